@@ -37,6 +37,18 @@ logger = logging.getLogger("search_client")
 # evaluation; caching avoids regenerating the same embedding each time.
 _embedding_cache: dict[str, list[float]] = {}
 
+# Shared embedding generator, created on first use. Building one creates a new
+# bedrock-runtime client, so it is reused for every uncached search term.
+_embedding_generator: EmbeddingGenerator | None = None
+
+
+def _get_embedding_generator() -> EmbeddingGenerator:
+    """Return the shared embedding generator, creating it on first use."""
+    global _embedding_generator
+    if _embedding_generator is None:
+        _embedding_generator = EmbeddingGenerator(settings.BEDROCK_EMBEDDING_MODEL_ID)
+    return _embedding_generator
+
 
 def _get_query_embedding(search_term: str) -> list[float]:
     """Return the embedding for a search term, using the in-memory cache."""
@@ -45,8 +57,7 @@ def _get_query_embedding(search_term: str) -> list[float]:
         logger.debug(f"Using cached embedding for search term: '{search_term}'")
         return cached
 
-    embedding_generator = EmbeddingGenerator(settings.BEDROCK_EMBEDDING_MODEL_ID)
-    embedding = embedding_generator.generate_embedding(search_term)
+    embedding = _get_embedding_generator().generate_embedding(search_term)
     _embedding_cache[search_term] = embedding
     logger.debug(f"Generated embedding for search term: '{search_term}'")
     return embedding
@@ -9,10 +9,12 @@ from evaluation_suite.search_evaluation.query import search_client
 
 @pytest.fixture(autouse=True)
 def _clear_embedding_cache():
-    """Clear the module-level embedding cache so tests are order-independent."""
+    """Clear the module-level embedding cache and generator so tests are order-independent."""
     search_client._embedding_cache.clear()
+    search_client._embedding_generator = None
     yield
     search_client._embedding_cache.clear()
+    search_client._embedding_generator = None
 
 
 def sample_hits():
@@ -140,6 +142,22 @@ def test_local_search_client_caches_embeddings(mock_embedding_gen, mock_get_clie
     assert mock_embedding_gen.return_value.generate_embedding.call_count == 1
 
 
+@patch("evaluation_suite.search_evaluation.query.search_client.get_opensearch_client")
+@patch("evaluation_suite.search_evaluation.query.search_client.EmbeddingGenerator")
+def test_local_search_client_reuses_embedding_generator(mock_embedding_gen, mock_get_client):
+    """Different search terms share one embedding generator instead of creating a client each time."""
+    mock_embedding_gen.return_value.generate_embedding.return_value = [0.1, 0.2]
+    mock_client = MagicMock()
+    mock_client.search.return_value = {"hits": {"hits": sample_hits()}}
+    mock_get_client.return_value = mock_client
+
+    search_client.local_search_client("fracture")
+    search_client.local_search_client("head injury")
+
+    mock_embedding_gen.assert_called_once()
+    assert mock_embedding_gen.return_value.generate_embedding.call_count == 2
+
+
 @patch("evaluation_suite.search_evaluation.query.search_client.get_opensearch_client")
 @patch("evaluation_suite.search_evaluation.query.search_client.EmbeddingGenerator")
 def test_local_search_client_raises_on_connection_error(mock_embedding_gen, mock_get_client):
@@ -62,7 +62,13 @@ else
                     "engine": "faiss",
                     "parameters": {
                         "ef_construction": 128,
-                        "m": 24
+                        "m": 24,
+                        "encoder": {
+                            "name": "sq",
+                            "parameters": {
+                                "type": "fp16"
+                            }
+                        }
                     }
                 }
             },
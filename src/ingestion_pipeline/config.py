@@ -57,6 +57,8 @@ class Settings(BaseSettings):  # type: ignore
     OPENSEARCH_SSL_ASSERT_HOSTNAME: bool = True
     OPENSEARCH_CHUNK_INDEX_NAME: str = "page_chunks"
     OPENSEARCH_PAGE_METADATA_INDEX_NAME: str = "page_metadata"
+    # Suspend chunk index refreshes during an ingest. Only enable for bulk reloads that own the index.
+    OPENSEARCH_SUSPEND_REFRESH_DURING_INGEST: bool = False
 
     # -- GLOBAL AWS CONFIGURATION --
     AWS_REGION: str = "eu-west-2"
@@ -117,6 +119,8 @@ class Settings(BaseSettings):  # type: ignore
     SYSTEM_UUID_NAMESPACE: str = "f0e1c2d3-4567-89ab-cdef-fedcba987654"
     TEXTRACT_API_POLL_INTERVAL_SECONDS: int = 5
     TEXTRACT_API_JOB_TIMEOUT_SECONDS: int = 600
+    # Ceiling for the wait between polls, which doubles after each IN_PROGRESS response.
+    TEXTRACT_API_MAX_POLL_INTERVAL_SECONDS: int = 30
 
     # Leaving this here for reference
     # In case we want to use these buckets
@@ -125,6 +129,11 @@ class Settings(BaseSettings):  # type: ignore
     # S3_PREFIX: str = "textract-test"
 
     BEDROCK_EMBEDDING_MODEL_ID: str = "amazon.titan-embed-text-v2:0"
+    # Maximum number of concurrent InvokeModel requests when embedding a document's chunks.
+    BEDROCK_EMBEDDING_MAX_WORKERS: int = 8
+    # Upper bounds for a single embedding micro-batch (token count is estimated from characters).
+    BEDROCK_EMBEDDING_BATCH_MAX_ITEMS: int = 96
+    BEDROCK_EMBEDDING_BATCH_MAX_TOKENS: int = 200_000
 
     # -- Local Development Mode --
     # Confgure via .env
@@ -167,6 +176,10 @@ class Settings(BaseSettings):  # type: ignore
         "WORDSTREAM_CHUNKER_MAX_WORDS",
         "WORDSTREAM_CHUNKER_FORWARD_LOOKAHEAD_WORDS",
         "WORDSTREAM_CHUNKER_BACKWARD_SCAN_WORDS",
+        "BEDROCK_EMBEDDING_MAX_WORKERS",
+        "BEDROCK_EMBEDDING_BATCH_MAX_ITEMS",
+        "BEDROCK_EMBEDDING_BATCH_MAX_TOKENS",
+        "TEXTRACT_API_MAX_POLL_INTERVAL_SECONDS",
     )
     @classmethod
     def validate_positive_int(cls, v: int) -> int:
@@ -0,0 +1,71 @@
+"""Token-aware packing of document chunks into embedding micro-batches."""
+
+from typing import Iterator, List, Sequence
+
+from ingestion_pipeline.chunking.schemas import DocumentChunk
+from ingestion_pipeline.config import settings
+
+# Rough characters-per-token ratio for English text. Titan does not publish its tokenizer,
+# so an estimate is used to keep each batch comfortably inside the tokens-per-minute quota.
+CHARS_PER_TOKEN = 4
+MAX_ITEMS_PER_BATCH = settings.BEDROCK_EMBEDDING_BATCH_MAX_ITEMS
+MAX_TOKENS_PER_BATCH = settings.BEDROCK_EMBEDDING_BATCH_MAX_TOKENS
+
+
+class EmbeddingBatcher:
+    """Groups chunks into sub-batches bounded by item count and estimated token count."""
+
+    def __init__(self, max_items: int = MAX_ITEMS_PER_BATCH, max_tokens: int = MAX_TOKENS_PER_BATCH):
+        """Initializes the batcher with its per-batch limits.
+
+        Args:
+            max_items (int): Maximum number of chunks in a single batch. Defaults to MAX_ITEMS_PER_BATCH.
+            max_tokens (int): Maximum estimated number of tokens in a single batch. Defaults to MAX_TOKENS_PER_BATCH.
+
+        Raises:
+            ValueError: If either limit is not a positive integer.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be a positive integer")
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be a positive integer")
+        self.max_items = max_items
+        self.max_tokens = max_tokens
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Estimates the number of tokens in the given text.
+
+        Args:
+            text (str): The text to estimate.
+
+        Returns:
+            int: The estimated token count, at least 1.
+        """
+        return max(1, len(text) // CHARS_PER_TOKEN)
+
+    def pack(self, chunks: Sequence[DocumentChunk]) -> Iterator[List[DocumentChunk]]:
+        """Yields consecutive batches of chunks that respect the configured limits.
+
+        A single chunk whose estimate exceeds max_tokens is yielded on its own rather than dropped.
+
+        Args:
+            chunks (Sequence[DocumentChunk]): The chunks to pack, in document order.
+
+        Yields:
+            List[DocumentChunk]: The next batch of chunks.
+        """
+        batch: List[DocumentChunk] = []
+        batch_tokens = 0
+
+        for chunk in chunks:
+            tokens = self.estimate_tokens(chunk.chunk_text)
+            if batch and (len(batch) >= self.max_items or batch_tokens + tokens > self.max_tokens):
+                yield batch
+                batch = []
+                batch_tokens = 0
+            batch.append(chunk)
+            batch_tokens += tokens
+
+        if batch:
+            yield batch
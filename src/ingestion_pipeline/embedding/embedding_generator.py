@@ -1,15 +1,23 @@
 """Embedding generator using Amazon Bedrock models."""
 
+import contextvars
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
+from botocore.config import Config
 
 from ingestion_pipeline.config import settings
 
 logger = logging.getLogger(__name__)
 # Set the model ID, e.g., Titan Text Embeddings V2.
 model_id = settings.BEDROCK_EMBEDDING_MODEL_ID
+MAX_WORKERS = settings.BEDROCK_EMBEDDING_MAX_WORKERS
+
+# Adaptive retries back off exponentially (with jitter) on ThrottlingException and
+# rate-limit the client, so bursts of concurrent requests settle under the account quota.
+BEDROCK_RETRY_CONFIG = Config(retries={"max_attempts": 10, "mode": "adaptive"})
 
 
 class EmbeddingError(Exception):
@@ -19,19 +27,23 @@ class EmbeddingError(Exception):
 class EmbeddingGenerator:
     """Generates embeddings using Amazon Bedrock models."""
 
-    def __init__(self, model_id: str):
+    def __init__(self, model_id: str, max_workers: int = MAX_WORKERS):
         """Initializes the EmbeddingGenerator with the specified model ID.
 
         Args:
             model_id (str): The ID of the Bedrock model to use for generating embeddings.
+            max_workers (int): Maximum number of concurrent Bedrock requests made by
+                generate_embeddings. Defaults to MAX_WORKERS.
         """
         self.model_id = model_id
+        self.max_workers = max_workers
         self.client = boto3.client(
             "bedrock-runtime",
             region_name=settings.AWS_REGION,
             aws_access_key_id=settings.AWS_MOD_PLATFORM_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_MOD_PLATFORM_SECRET_ACCESS_KEY,
             aws_session_token=getattr(settings, "AWS_MOD_PLATFORM_SESSION_TOKEN", None),  # Optional
+            config=BEDROCK_RETRY_CONFIG,
         )
 
     def generate_embedding(self, text: str) -> list[float]:
@@ -55,3 +67,31 @@ class EmbeddingGenerator:
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             raise EmbeddingError(f"Failed to generate embeddings for chunks: {str(e)}") from e
+
+    def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generates embeddings for a batch of texts.
+
+        Titan text embedding models only accept a single input per InvokeModel call, so the
+        requests are issued concurrently (the boto3 client is thread-safe) rather than one
+        after another. Results are returned in the same order as the input texts.
+
+        Args:
+            texts: The input texts to generate embeddings for.
+
+        Returns:
+            A list of embeddings, one per input text.
+
+        Raises:
+            EmbeddingError: If generating any of the embeddings fails.
+        """
+        if not texts:
+            return []
+
+        workers = min(self.max_workers, len(texts))
+        if workers <= 1:
+            return [self.generate_embedding(text) for text in texts]
+
+        # Each task runs in its own copy of the caller's context so worker logs keep the source_doc_id prefix.
+        ctx = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda text: ctx.copy().run(self.generate_embedding, text), texts))
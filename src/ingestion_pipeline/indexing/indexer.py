@@ -4,15 +4,24 @@ Supports a single proxy/base URL which may include the path (url prefix).
 """
 
 import logging
+import time
 from collections import Counter
 from typing import Any, List
 from urllib.parse import urlparse
 
 from opensearchpy import OpenSearch, helpers
-from opensearchpy.exceptions import ConflictError
+from opensearchpy.exceptions import ConflictError, ConnectionTimeout, TransportError
 
 logger = logging.getLogger(__name__)
 
+# Retry settings for bulk requests rejected with 429 or that time out.
+BULK_MAX_RETRIES = 3
+BULK_RETRY_BASE_DELAY_SECONDS = 1
+RETRYABLE_ITEM_STATUSES = frozenset({429, 503})
+
+# Only the fields needed to detect and summarise failures are returned for each bulk item.
+BULK_RESPONSE_FILTER_PATH = "errors,items.*._id,items.*.status,items.*.error"
+
 
 class IndexingError(Exception):
     """Custom exception for indexing failures."""
@@ -21,6 +30,10 @@ class IndexingError(Exception):
 class OpenSearchIndexer:
     """Handles bulk indexing of documents into an OpenSearch index.
 
+    Can be used as a context manager around a bulk reload. When constructed with ``suspend_refresh=True``
+    periodic index refreshes are suspended for the duration of the reload; the previous refresh interval
+    is restored and a single refresh issued on exit. Otherwise the context manager changes nothing.
+
     Args:
         index_name: Target index name.
         proxy_url: Full proxy/base URL, e.g. 'http://proxy:8080'
@@ -33,6 +46,9 @@ class OpenSearchIndexer:
         proxy_url: str,
         verify_certs: bool = True,
         ssl_assert_hostname: bool = True,
+        thread_count: int = 4,
+        chunk_size: int = 50,
+        suspend_refresh: bool = False,
     ):
         """Initialize the indexer connection using a single proxy URL.
 
@@ -44,6 +60,10 @@ class OpenSearchIndexer:
                 Set to False only for development environments with self-signed certificates.
             ssl_assert_hostname (bool): Whether to assert the hostname in TLS certificates. Defaults to True.
                 Set to False only for development environments with self-signed certificates.
+            thread_count (int): Number of bulk requests sent concurrently. Defaults to 4.
+            chunk_size (int): Number of documents per bulk request. Defaults to 50.
+            suspend_refresh (bool): Whether to suspend index refreshes while used as a context manager.
+                Defaults to False, leaving the settings of a shared index untouched.
 
         Raises:
             ValueError: If the index name is empty.
@@ -53,6 +73,12 @@ class OpenSearchIndexer:
         if not index_name:
             raise ValueError("Index name cannot be empty.")
         self.index_name = index_name
+        self.thread_count = thread_count
+        self.chunk_size = chunk_size
+        self.suspend_refresh = suspend_refresh
+        self._refresh_suspended = False
+        self._restore_refresh_interval = False
+        self._previous_refresh_interval: str | None = None
 
         if not proxy_url:
             raise ValueError("The OpenSearch proxy URL cannot be empty.")
@@ -81,11 +107,64 @@ class OpenSearchIndexer:
             verify_certs=verify_certs,
             ssl_assert_hostname=ssl_assert_hostname,
             timeout=30,
+            # Keep enough pooled keep-alive connections for every parallel bulk thread to reuse its own.
+            pool_maxsize=self.thread_count * 2,
+            # Gzip request bodies; bulk payloads of chunk text and embedding vectors compress well.
+            http_compress=True,
         )
 
         logger.info("Client initialised for index '%s'", self.index_name)
 
-    def index_documents(self, documents: List[Any], id_field: str = "chunk_id"):
+    def __enter__(self) -> "OpenSearchIndexer":
+        """Suspends periodic refreshes of the index while documents are bulk indexed.
+
+        Nothing is changed unless ``suspend_refresh`` was requested, or if the index does not exist yet;
+        it is created by the first bulk request.
+        """
+        if not self.suspend_refresh:
+            return self
+        if not self.client.indices.exists(index=self.index_name):
+            logger.info(f"Index {self.index_name} does not exist yet; leaving refresh unchanged")
+            return self
+        response = self.client.indices.get_settings(index=self.index_name, name="index.refresh_interval")
+        # The response is keyed by the concrete index name, which differs from index_name for an alias.
+        index_settings = next(iter(response.values()), {}).get("settings", {})
+        previous_interval = index_settings.get("index", {}).get("refresh_interval")
+        self._refresh_suspended = True
+        if previous_interval == "-1":
+            # Another reload owns the suspension and will restore the interval it read.
+            logger.info(f"Refresh on index {self.index_name} is already suspended")
+            return self
+        self.client.indices.put_settings(index=self.index_name, body={"index": {"refresh_interval": "-1"}})
+        self._previous_refresh_interval = previous_interval
+        self._restore_refresh_interval = True
+        logger.info(f"Suspended refresh on index {self.index_name}")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Restores the previous refresh interval and refreshes the index once.
+
+        A failure to restore is raised if the ingest itself succeeded, and only logged otherwise so
+        that it does not mask the original error.
+        """
+        if not self._refresh_suspended:
+            return
+        try:
+            self._refresh_suspended = False
+            if self._restore_refresh_interval:
+                # None resets the setting to the cluster default when no explicit interval was configured.
+                self.client.indices.put_settings(
+                    index=self.index_name, body={"index": {"refresh_interval": self._previous_refresh_interval}}
+                )
+                self._restore_refresh_interval = False
+                logger.info(f"Restored refresh on index {self.index_name}")
+            self.client.indices.refresh(index=self.index_name)
+        except Exception as e:
+            logger.error(f"Failed to restore refresh on index {self.index_name}: {e}", exc_info=True)
+            if exc_type is None:
+                raise IndexingError(f"Failed to restore refresh on index {self.index_name}: {str(e)}") from e
+
+    def index_documents(self, documents: List[Any], id_field: str = "chunk_id", replace_existing: bool = True):
         """Indexes a list of Pydantic models into OpenSearch using the Bulk API.
 
         Deletes any existing documents with the same source_doc_id before indexing new ones.
@@ -95,6 +174,9 @@ class OpenSearchIndexer:
             documents (List[Any]): A list of Pydantic models to index (e.g., DocumentChunk or DocumentPage).
             id_field (str): The attribute name on the model to use as the document's _id.
                 Defaults to "chunk_id".
+            replace_existing (bool): Whether to delete existing documents with the same source_doc_id
+                first. Pass False when indexing later batches of a document that is already being
+                replaced. Defaults to True.
 
         Returns:
             Tuple[int, List]: A tuple containing:
@@ -109,19 +191,15 @@ class OpenSearchIndexer:
             return 0, []
 
         source_doc_id = documents[0].source_doc_id
-        if self.client.indices.exists(index=self.index_name):
+        if replace_existing and self.client.indices.exists(index=self.index_name):
             logger.info(
                 f"Attempting document deletion of existing documents from index {self.index_name} before reindexing"
             )
             self.delete_documents_by_source_doc_id(source_doc_id)
-        actions = self._generate_bulk_actions(documents, id_field)
 
         try:
             logger.info(f"Indexing {len(documents)} documents into index {self.index_name}")
-            # raise_on_error=False
-            # allows the function to continue and collect all errors,
-            # so we can handle them (log, retry, cleanup) instead of immediately stopping on the first error.
-            success, errors = helpers.bulk(self.client, actions, raise_on_error=False, chunk_size=50)
+            success, errors = self._bulk_with_retry(documents, id_field)
 
             if errors:
                 logger.debug("Bulk indexing errors for index %s: %s", self.index_name, errors)
@@ -142,6 +220,101 @@ class OpenSearchIndexer:
             self.delete_documents_by_source_doc_id(source_doc_id)
             raise IndexingError(f"Failed to index: {str(e)}") from e
 
+    def _bulk_with_retry(self, documents: List[Any], id_field: str) -> tuple[int, List[Any]]:
+        """Runs the bulk request, retrying with exponential backoff when OpenSearch is overloaded.
+
+        If the whole request times out or is rejected with 429, the batch is sent again. If only some
+        items are rejected with a retryable status, just those documents are resent. Retrying is safe
+        because every action is an ``index`` with a fixed, deterministic _id.
+
+        Args:
+            documents (List[Any]): List of Pydantic models to be indexed.
+            id_field (str): Attribute name to use as the document's unique identifier.
+
+        Returns:
+            tuple[int, List[Any]]: The total number of successfully indexed documents and the per-item
+                errors still outstanding after the final attempt.
+
+        Raises:
+            TransportError: If the request is still rejected or timing out after BULK_MAX_RETRIES attempts.
+        """
+        pending = documents
+        success = 0
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                batch_success, errors = self._parallel_bulk(pending, id_field)
+            except TransportError as e:
+                if not self._is_retryable_bulk_error(e) or attempt >= BULK_MAX_RETRIES:
+                    raise
+                logger.warning(f"Bulk request to index {self.index_name} failed (attempt {attempt}), retrying: {e}")
+                time.sleep(BULK_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+                continue
+
+            success += batch_success
+            # Only retry when every failure is transient; any other error fails the batch regardless.
+            if not errors or not all(self._is_retryable_item(error) for error in errors) or attempt >= BULK_MAX_RETRIES:
+                return success, errors
+
+            retryable_ids = {self._bulk_item(error).get("_id") for error in errors}
+            retry_documents = [doc for doc in pending if getattr(doc, id_field) in retryable_ids]
+            if len(retry_documents) != len(errors):
+                return success, errors
+
+            pending = retry_documents
+            logger.warning(
+                f"{len(pending)} document(s) rejected by index {self.index_name} (attempt {attempt}), retrying them"
+            )
+            time.sleep(BULK_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+
+    def _parallel_bulk(self, documents: List[Any], id_field: str) -> tuple[int, List[Any]]:
+        """Streams bulk actions to OpenSearch over several concurrent requests.
+
+        Args:
+            documents (List[Any]): List of Pydantic models to be indexed.
+            id_field (str): Attribute name to use as the document's unique identifier.
+
+        Returns:
+            tuple[int, List[Any]]: The number of successfully indexed documents and the per-item errors.
+        """
+        success = 0
+        errors: List[Any] = []
+        # raise_on_error=False
+        # allows the helper to continue and collect all errors,
+        # so we can handle them (log, cleanup) instead of immediately stopping on the first error.
+        for ok, info in helpers.parallel_bulk(
+            self.client,
+            self._generate_bulk_actions(documents, id_field),
+            thread_count=self.thread_count,
+            chunk_size=self.chunk_size,
+            queue_size=self.thread_count * 2,
+            raise_on_error=False,
+            filter_path=BULK_RESPONSE_FILTER_PATH,
+            index=self.index_name,
+        ):
+            if ok:
+                success += 1
+            else:
+                errors.append(info)
+        return success, errors
+
+    @staticmethod
+    def _is_retryable_bulk_error(error: TransportError) -> bool:
+        """Return True for bulk failures caused by an overloaded or slow cluster."""
+        return isinstance(error, ConnectionTimeout) or error.status_code == 429
+
+    @staticmethod
+    def _bulk_item(error: Any) -> dict:
+        """Return the per-operation payload of a bulk error item, e.g. the value under "index"."""
+        payload = next(iter(error.values()), {}) if isinstance(error, dict) else {}
+        return payload if isinstance(payload, dict) else {}
+
+    @classmethod
+    def _is_retryable_item(cls, error: Any) -> bool:
+        """Return True for bulk items rejected because the cluster was temporarily overloaded."""
+        return cls._bulk_item(error).get("status") in RETRYABLE_ITEM_STATUSES
+
     def _format_bulk_error_summary(self, errors: List[Any], top_n: int = 3) -> str:
         """Create a compact summary for bulk index failures.
 
@@ -151,9 +324,9 @@ class OpenSearchIndexer:
         grouped_errors: Counter[tuple[str, str, str]] = Counter()
 
         for item in errors:
-            op_payload = next(iter(item.values()), {}) if isinstance(item, dict) else {}
+            op_payload = self._bulk_item(item)
             status = str(op_payload.get("status", "unknown"))
-            error_payload = op_payload.get("error", {}) if isinstance(op_payload, dict) else {}
+            error_payload = op_payload.get("error", {})
             error_type = str(error_payload.get("type", "unknown"))
             reason = str(error_payload.get("reason", "unknown"))
             grouped_errors[(status, error_type, reason)] += 1
@@ -168,6 +341,16 @@ class OpenSearchIndexer:
     def _generate_bulk_actions(self, documents: List[Any], id_field: str):
         """Generates OpenSearch bulk actions from a list of Pydantic models.
 
+        The document source is serialised to a JSON string by Pydantic's Rust serializer. The bulk
+        helper passes strings through untouched, so this skips building an intermediate dict and
+        encoding it again with the stdlib json module.
+
+        Every action is routed by its source_doc_id, so all chunks or pages of one document are
+        written to the same shard.
+
+        The target index is not repeated in each action header; it is set once on the bulk request
+        URL by _parallel_bulk.
+
         Args:
             documents (List[Any]): List of Pydantic models to be indexed.
             id_field (str): Attribute name to use as the document's unique identifier.
@@ -176,7 +359,7 @@ class OpenSearchIndexer:
             AttributeError: Raised if a document does not have the specified id_field.
 
         Yields:
-            dict: Bulk action dictionaries for OpenSearch indexing.
+            dict: Bulk action dictionaries for OpenSearch indexing, with the source pre-serialised as JSON.
         """
         for doc in documents:
             if not hasattr(doc, id_field):
@@ -184,9 +367,9 @@ class OpenSearchIndexer:
 
             yield {
                 "_op_type": "index",
-                "_index": self.index_name,
                 "_id": getattr(doc, id_field),
-                "_source": doc.model_dump(),
+                "routing": doc.source_doc_id,
+                "_source": doc.model_dump_json(),
             }
 
     def delete_documents_by_source_doc_id(self, source_doc_id: str):
@@ -201,6 +384,9 @@ class OpenSearchIndexer:
         """
         query = {"query": {"match": {"source_doc_id": source_doc_id}}}
         try:
+            if self._refresh_suspended:
+                # delete_by_query only sees refreshed documents, so make this ingest's writes visible first.
+                self.client.indices.refresh(index=self.index_name)
             response = self.client.delete_by_query(index=self.index_name, body=query)
             deleted_count = response.get("deleted", 0)
             if deleted_count > 0:
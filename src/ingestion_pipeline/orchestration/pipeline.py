@@ -1,10 +1,14 @@
 """Orchestration pipeline for chunking and indexing documents."""
 
+import contextvars
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List
 
 from ingestion_pipeline.chunking.chunk_strategy import ChunkError, ChunkStrategy
-from ingestion_pipeline.chunking.schemas import DocumentMetadata
+from ingestion_pipeline.chunking.schemas import DocumentChunk, DocumentMetadata
 from ingestion_pipeline.config import settings
+from ingestion_pipeline.embedding.embedding_batcher import EmbeddingBatcher
 from ingestion_pipeline.embedding.embedding_generator import EmbeddingError, EmbeddingGenerator
 from ingestion_pipeline.indexing.indexer import IndexingError, OpenSearchIndexer
 from ingestion_pipeline.page_processor.processor import PageProcessor
@@ -35,6 +39,7 @@ class Pipeline:
         chunk_indexer: OpenSearchIndexer,
         page_indexer: OpenSearchIndexer,
         page_processor: PageProcessor,
+        embedding_batcher: EmbeddingBatcher | None = None,
     ):
         """Initializes the orchestrator with injected dependencies.
 
@@ -45,6 +50,8 @@ class Pipeline:
             chunk_indexer: Indexer to store documents in OpenSearch.
             page_indexer: Indexer to store document pages in OpenSearch.
             page_processor: Processor to handle page-level processing.
+            embedding_batcher: Packs chunks into embedding micro-batches. Defaults to an
+                EmbeddingBatcher with its default limits.
         """
         self.textract_processor = textract_processor
         self.chunker = chunker
@@ -52,6 +59,7 @@ class Pipeline:
         self.chunk_indexer = chunk_indexer
         self.page_indexer = page_indexer
         self.page_processor = page_processor
+        self.embedding_batcher = embedding_batcher or EmbeddingBatcher()
 
     def process_document(self, document_metadata: DocumentMetadata):
         """Runs the full pipeline for a single document.
@@ -89,12 +97,9 @@ class Pipeline:
                 logger.warning("No chunks were generated. Skipping embedding and indexing.")
                 return
 
-            logger.info(f"Generating embeddings for {len(processed_data.chunks)} chunks")
-            for chunk in processed_data.chunks:
-                chunk.embedding = self.embedding_generator.generate_embedding(chunk.chunk_text)
-            logger.info(f"Finished generating embeddings for {len(processed_data.chunks)} chunks")
-
-            self.chunk_indexer.index_documents(processed_data.chunks)
+            logger.info(f"Generating embeddings and indexing {len(processed_data.chunks)} chunks")
+            with self.chunk_indexer:
+                self._embed_and_index_chunks(processed_data.chunks)
             logger.info("Successfully finished processing document")
 
         except (TextractProcessingError, EmbeddingError, IndexingError, ChunkError) as e:
@@ -106,6 +111,51 @@ class Pipeline:
             self._cleanup_indexed_data(source_doc_id)
             raise PipelineError(f"Unexpected pipeline failure: {str(e)}") from e
 
+    def _embed_and_index_chunks(self, chunks: List[DocumentChunk]):
+        """Embeds and indexes chunks one micro-batch at a time, overlapping the two stages.
+
+        While a batch is being indexed on a background writer thread, the next batch is
+        embedded on the calling thread, so the Bedrock and OpenSearch round trips run
+        concurrently. At most one batch is in flight with the writer, and batches are
+        indexed in order. Only the first batch replaces previously indexed chunks of the
+        document; later batches are appended. Once a batch is indexed its embeddings are
+        released, so at most two batches of vectors are held in memory at a time.
+
+        Args:
+            chunks (List[DocumentChunk]): The chunks of a single document.
+
+        Raises:
+            EmbeddingError: If embedding generation fails.
+            IndexingError: If OpenSearch indexing fails.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-indexer") as writer:
+            pending_write: Future | None = None
+            for batch_number, batch in enumerate(self.embedding_batcher.pack(chunks)):
+                embeddings = self.embedding_generator.generate_embeddings([chunk.chunk_text for chunk in batch])
+                for chunk, embedding in zip(batch, embeddings, strict=True):
+                    chunk.embedding = embedding
+
+                if pending_write is not None:
+                    pending_write.result()
+                # Run in a copy of the caller's context so indexer logs keep the source_doc_id prefix.
+                pending_write = writer.submit(
+                    contextvars.copy_context().run, self._index_batch, batch, replace_existing=batch_number == 0
+                )
+
+            if pending_write is not None:
+                pending_write.result()
+
+    def _index_batch(self, batch: List[DocumentChunk], replace_existing: bool):
+        """Indexes one embedded batch of chunks, then drops their embeddings to free memory.
+
+        Args:
+            batch (List[DocumentChunk]): The embedded chunks to index.
+            replace_existing (bool): Whether to delete the document's previously indexed chunks first.
+        """
+        self.chunk_indexer.index_documents(batch, replace_existing=replace_existing)
+        for chunk in batch:
+            chunk.embedding = None
+
     def _cleanup_indexed_data(self, source_doc_id: str):
         """Removes any indexed data for a failed document.
 
@@ -10,6 +10,7 @@ from ingestion_pipeline.aws_client.clients import (
 from ingestion_pipeline.chunking.chunk_strategy_factory import get_chunk_strategy
 from ingestion_pipeline.config import settings
 from ingestion_pipeline.custom_logging.log_context import setup_logging
+from ingestion_pipeline.embedding.embedding_batcher import EmbeddingBatcher
 from ingestion_pipeline.embedding.embedding_generator import EmbeddingGenerator
 from ingestion_pipeline.indexing.indexer import OpenSearchIndexer
 from ingestion_pipeline.orchestration.pipeline import Pipeline
@@ -41,12 +42,20 @@ def build_pipeline() -> Pipeline:
     chunking_strategy = settings.DOCUMENT_CHUNKING_STRATEGY.strip().lower()
     chunker = get_chunk_strategy(chunking_strategy)
 
-    embedding_generator = EmbeddingGenerator(model_id=settings.BEDROCK_EMBEDDING_MODEL_ID)
+    embedding_generator = EmbeddingGenerator(
+        model_id=settings.BEDROCK_EMBEDDING_MODEL_ID,
+        max_workers=settings.BEDROCK_EMBEDDING_MAX_WORKERS,
+    )
+    embedding_batcher = EmbeddingBatcher(
+        max_items=settings.BEDROCK_EMBEDDING_BATCH_MAX_ITEMS,
+        max_tokens=settings.BEDROCK_EMBEDDING_BATCH_MAX_TOKENS,
+    )
     chunk_indexer = OpenSearchIndexer(
         index_name=settings.OPENSEARCH_CHUNK_INDEX_NAME,
         proxy_url=settings.OPENSEARCH_PROXY_URL,
         verify_certs=settings.OPENSEARCH_VERIFY_CERTS,
         ssl_assert_hostname=settings.OPENSEARCH_SSL_ASSERT_HOSTNAME,
+        suspend_refresh=settings.OPENSEARCH_SUSPEND_REFRESH_DURING_INGEST,
     )
     page_indexer = OpenSearchIndexer(
         index_name=settings.OPENSEARCH_PAGE_METADATA_INDEX_NAME,
@@ -77,4 +86,5 @@ def build_pipeline() -> Pipeline:
         chunk_indexer=chunk_indexer,
         page_indexer=page_indexer,
         page_processor=page_processor,
+        embedding_batcher=embedding_batcher,
     )
@@ -22,6 +22,9 @@ CHUNK_INDEX_NAME = settings.OPENSEARCH_CHUNK_INDEX_NAME
 # --- Configuration for Polling ---
 POLL_INTERVAL_SECONDS = settings.TEXTRACT_API_POLL_INTERVAL_SECONDS
 JOB_TIMEOUT_SECONDS = settings.TEXTRACT_API_JOB_TIMEOUT_SECONDS
+# The wait between polls doubles after each IN_PROGRESS response, up to this ceiling, so long
+# jobs make far fewer GetDocumentAnalysis calls while short jobs are still picked up quickly.
+MAX_POLL_INTERVAL_SECONDS = settings.TEXTRACT_API_MAX_POLL_INTERVAL_SECONDS
 
 # Local development mode flag (can be set via environment variable)
 # This will switch the S3 URI to point to a mod platform bucket for AWS Textract integration.
@@ -42,6 +45,7 @@ class TextractProcessor:
         textract_client,
         timeout_seconds: int = JOB_TIMEOUT_SECONDS,
         poll_interval: int = POLL_INTERVAL_SECONDS,
+        max_poll_interval: int = MAX_POLL_INTERVAL_SECONDS,
     ):
         """Initializes the TextractProcessor with required dependencies and configuration.
 
@@ -50,13 +54,17 @@ class TextractProcessor:
             textract_client: Boto3 Textract client for API calls.
             timeout_seconds (int, optional): Maximum time to wait for Textract job completion.
                 Defaults to JOB_TIMEOUT_SECONDS.
-            poll_interval (int, optional): Interval (in seconds) between polling Textract job status.
+            poll_interval (int, optional): Initial interval (in seconds) between polling Textract job status.
+                The interval doubles after each poll, up to max_poll_interval.
                 Defaults to POLL_INTERVAL_SECONDS.
+            max_poll_interval (int, optional): Ceiling (in seconds) for the interval between polls.
+                Defaults to MAX_POLL_INTERVAL_SECONDS.
         """
         self.textractor = textractor
         self.textract_client = textract_client
         self.timeout_seconds = timeout_seconds
         self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
 
     def _start_textract_job(self, s3_document_uri: str) -> str:
         """Starts a Textract document analysis job.
@@ -88,8 +96,10 @@ class TextractProcessor:
         Raises:
             TimeoutError: If the job does not complete within the configured timeout period.
         """
-        start_time = time.time()
-        while time.time() - start_time < self.timeout_seconds:
+        wait = self.poll_interval
+        max_wait = max(self.poll_interval, self.max_poll_interval)
+        deadline = time.time() + self.timeout_seconds
+        while time.time() < deadline:
             response = self.textract_client.get_document_analysis(JobId=job_id)
             status = response["JobStatus"]
             logger.info(f"Textract Job {job_id} {status}")
@@ -97,7 +107,12 @@ class TextractProcessor:
             if status in ["SUCCEEDED", "FAILED", "PARTIAL_SUCCESS"]:
                 return status
 
-            time.sleep(self.poll_interval)
+            # Never sleep past the deadline, so the timeout is not overrun by a long backoff.
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(wait, remaining))
+            wait = min(wait * 2, max_wait)
 
         raise TimeoutError(f"Textract job {job_id} timed out after {self.timeout_seconds} seconds.")
 
@@ -37,7 +37,7 @@ def chunking_config() -> LayoutChunkingConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def document_metadata() -> DocumentMetadata:
     """Provides a sample DocumentMetadata instance."""
     import datetime
@@ -39,7 +39,7 @@ def create_mock_document(pages, response={"some": "data"}):
     return doc
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def document_metadata():
     """Provides a DocumentMetadata instance for tests."""
     return DocumentMetadata(
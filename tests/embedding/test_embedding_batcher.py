@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ingestion_pipeline.config import settings
+from ingestion_pipeline.embedding.embedding_batcher import EmbeddingBatcher
+
+
+def _chunks(*texts):
+    return [SimpleNamespace(chunk_text=text) for text in texts]
+
+
+def _texts(batches):
+    return [[chunk.chunk_text for chunk in batch] for batch in batches]
+
+
+def test_default_limits_come_from_settings():
+    batcher = EmbeddingBatcher()
+
+    assert batcher.max_items == settings.BEDROCK_EMBEDDING_BATCH_MAX_ITEMS
+    assert batcher.max_tokens == settings.BEDROCK_EMBEDDING_BATCH_MAX_TOKENS
+
+
+def test_pack_with_no_chunks_yields_nothing():
+    assert list(EmbeddingBatcher().pack([])) == []
+
+
+def test_pack_keeps_small_input_in_a_single_batch():
+    chunks = _chunks("a", "b", "c")
+
+    assert list(EmbeddingBatcher().pack(chunks)) == [chunks]
+
+
+def test_pack_splits_on_max_items():
+    batches = EmbeddingBatcher(max_items=2).pack(_chunks("a", "b", "c", "d", "e"))
+
+    assert _texts(batches) == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_pack_splits_on_max_tokens():
+    # Each 40-character text is estimated at 10 tokens.
+    texts = ["x" * 40, "y" * 40, "z" * 40]
+
+    batches = EmbeddingBatcher(max_tokens=25).pack(_chunks(*texts))
+
+    assert _texts(batches) == [[texts[0], texts[1]], [texts[2]]]
+
+
+def test_pack_yields_oversized_chunk_on_its_own():
+    texts = ["small", "x" * 400, "tiny"]
+
+    batches = EmbeddingBatcher(max_tokens=10).pack(_chunks(*texts))
+
+    assert _texts(batches) == [["small"], [texts[1]], ["tiny"]]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("", 1), ("abc", 1), ("abcd", 1), ("a" * 400, 100)],
+)
+def test_estimate_tokens(text, expected):
+    assert EmbeddingBatcher.estimate_tokens(text) == expected
+
+
+@pytest.mark.parametrize("kwargs", [{"max_items": 0}, {"max_tokens": 0}, {"max_items": -1}])
+def test_init_rejects_non_positive_limits(kwargs):
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        EmbeddingBatcher(**kwargs)
@@ -1,8 +1,16 @@
+import json
+import logging
 from unittest import mock
 
 import pytest
 
-from ingestion_pipeline.embedding.embedding_generator import EmbeddingGenerator
+from ingestion_pipeline.config import settings
+from ingestion_pipeline.custom_logging.log_context import ContextFilter, source_doc_id_context
+from ingestion_pipeline.embedding.embedding_generator import (
+    BEDROCK_RETRY_CONFIG,
+    EmbeddingError,
+    EmbeddingGenerator,
+)
 
 
 @pytest.fixture
@@ -58,3 +66,84 @@ def test_init_sets_model_id_and_client(mock_settings):
         generator = EmbeddingGenerator(model_id="abc")
         assert generator.model_id == "abc"
         assert generator.client == mock_client.return_value
+
+
+def test_init_defaults_max_workers_from_settings(mock_boto_client):
+    generator = EmbeddingGenerator(model_id="abc")
+
+    assert generator.max_workers == settings.BEDROCK_EMBEDDING_MAX_WORKERS
+
+
+def test_init_configures_adaptive_retries(mock_boto_client, mock_settings):
+    EmbeddingGenerator(model_id="abc")
+
+    config = mock_boto_client.call_args.kwargs["config"]
+    assert config is BEDROCK_RETRY_CONFIG
+    assert config.retries == {"max_attempts": 10, "mode": "adaptive"}
+
+
+def _mock_invoke_model_response(body: str):
+    mock_response = mock.MagicMock()
+    mock_response_body = mock.Mock()
+    mock_response_body.read.return_value = body
+    mock_response.__getitem__.side_effect = lambda k: mock_response_body if k == "body" else None
+    return mock_response
+
+
+def test_generate_embeddings_returns_embeddings_in_input_order(mock_boto_client, mock_settings):
+    def invoke_model(modelId, body):
+        text = json.loads(body)["inputText"]
+        return _mock_invoke_model_response(json.dumps({"embedding": [float(len(text))]}))
+
+    mock_boto_client.return_value.invoke_model.side_effect = invoke_model
+    generator = EmbeddingGenerator(model_id="test-model-id", max_workers=4)
+
+    result = generator.generate_embeddings(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert result == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert mock_boto_client.return_value.invoke_model.call_count == 5
+
+
+def test_generate_embeddings_with_single_worker_runs_sequentially(mock_boto_client, mock_settings):
+    mock_boto_client.return_value.invoke_model.return_value = _mock_invoke_model_response('{"embedding": [0.5]}')
+    generator = EmbeddingGenerator(model_id="test-model-id", max_workers=1)
+
+    with mock.patch("ingestion_pipeline.embedding.embedding_generator.ThreadPoolExecutor") as mock_executor:
+        result = generator.generate_embeddings(["one", "two"])
+
+    mock_executor.assert_not_called()
+    assert result == [[0.5], [0.5]]
+
+
+def test_generate_embeddings_with_no_texts_returns_empty_list(mock_boto_client, mock_settings):
+    generator = EmbeddingGenerator(model_id="test-model-id")
+
+    assert generator.generate_embeddings([]) == []
+    mock_boto_client.return_value.invoke_model.assert_not_called()
+
+
+def test_generate_embeddings_raises_embedding_error_on_failure(mock_boto_client, mock_settings):
+    mock_boto_client.return_value.invoke_model.side_effect = RuntimeError("throttled")
+    generator = EmbeddingGenerator(model_id="test-model-id", max_workers=2)
+
+    with pytest.raises(EmbeddingError, match="throttled"):
+        generator.generate_embeddings(["one", "two"])
+
+
+def test_generate_embeddings_keeps_source_doc_id_in_worker_logs(mock_boto_client, mock_settings, caplog, monkeypatch):
+    mock_boto_client.return_value.invoke_model.side_effect = RuntimeError("throttled")
+    generator = EmbeddingGenerator(model_id="test-model-id", max_workers=2)
+    caplog.set_level(logging.ERROR, logger="ingestion_pipeline.embedding.embedding_generator")
+    # Capture through a single filtered handler, as in production; ContextFilter rewrites the record in place.
+    monkeypatch.setattr(caplog.handler, "filters", [ContextFilter()])
+    monkeypatch.setattr(logging.getLogger(), "handlers", [caplog.handler])
+
+    token = source_doc_id_context.set("DOC-123")
+    try:
+        with pytest.raises(EmbeddingError):
+            generator.generate_embeddings(["one", "two"])
+    finally:
+        source_doc_id_context.reset(token)
+
+    assert caplog.messages
+    assert all(message.startswith("DOC-123 Embedding generation failed") for message in caplog.messages)
@@ -1,14 +1,16 @@
 import datetime
-import logging
-from unittest.mock import MagicMock
+import json
+from unittest.mock import MagicMock, call
 
 import pytest
-from opensearchpy.helpers import BulkIndexError
+from opensearchpy.exceptions import ConnectionTimeout, TransportError
+from opensearchpy.helpers import BulkIndexError, expand_action
+from opensearchpy.serializer import JSONSerializer
 
 from ingestion_pipeline.chunking.schemas import DocumentBoundingBox, DocumentChunk, DocumentPage
 from ingestion_pipeline.indexing.indexer import IndexingError, OpenSearchIndexer
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+RECEIVED_DATE = datetime.datetime(2025, 11, 6)
 
 
 @pytest.fixture
@@ -21,16 +23,20 @@ def mock_opensearch_client(mocker):
 
 
 @pytest.fixture
-def mock_helpers_bulk(mocker):
-    """Mocks the opensearchpy.helpers.bulk function using pytest-mock."""
-    return mocker.patch("ingestion_pipeline.indexing.indexer.helpers.bulk", autospec=True)
+def mock_parallel_bulk(mocker):
+    """Mocks the opensearchpy.helpers.parallel_bulk function using pytest-mock."""
+    return mocker.patch("ingestion_pipeline.indexing.indexer.helpers.parallel_bulk", autospec=True)
 
 
-@pytest.fixture
-def sample_documents():
-    """Provides a list of sample OpenSearchDocument objects for testing."""
+def _bulk_results(success_count, errors=()):
+    """Builds the (ok, item) tuples yielded by parallel_bulk."""
+    return [(True, {"index": {"status": 201}})] * success_count + [(False, error) for error in errors]
+
+
+def _sample_chunk_fields():
+    """Returns the field values for the two sample chunks shared by the fixtures and the contract test."""
     return [
-        DocumentChunk(
+        dict(
             chunk_id="doc1-p1-c0",
             source_doc_id="doc1",
             source_file_name="file1.pdf",
@@ -43,10 +49,10 @@ def sample_documents():
             chunk_type="LAYOUT_TEXT",
             chunk_text="This is the first chunk.",
             confidence=0.95,
-            received_date=datetime.datetime.fromisoformat("2025-11-06"),
-            bounding_box=DocumentBoundingBox(Width=0.1, Height=0.1, Left=0.1, Top=0.1),
+            received_date=RECEIVED_DATE,
+            bounding_box=dict(Width=0.1, Height=0.1, Left=0.1, Top=0.1),
         ),
-        DocumentChunk(
+        dict(
             chunk_id="doc1-p1-c1",
             source_doc_id="doc1",
             source_file_name="file1.pdf",
@@ -59,12 +65,35 @@ def sample_documents():
             chunk_type="LAYOUT_TEXT",
             chunk_text="This is the second chunk.",
             confidence=0.96,
-            received_date=datetime.datetime.fromisoformat("2025-11-06"),
-            bounding_box=DocumentBoundingBox(Width=0.2, Height=0.2, Left=0.2, Top=0.2),
+            received_date=RECEIVED_DATE,
+            bounding_box=dict(Width=0.2, Height=0.2, Left=0.2, Top=0.2),
         ),
     ]
 
 
+@pytest.fixture
+def sample_documents():
+    """Provides a list of sample OpenSearchDocument objects for testing.
+
+    The data is known-good, so the models are built with ``model_construct`` to skip validation.
+    ``test_sample_documents_match_validated_construction`` guards the validated path.
+    """
+    return [
+        DocumentChunk.model_construct(
+            **{**fields, "bounding_box": DocumentBoundingBox.model_construct(**fields["bounding_box"])}
+        )
+        for fields in _sample_chunk_fields()
+    ]
+
+
+def test_sample_documents_match_validated_construction(sample_documents):
+    """Tests that the unvalidated sample chunks are identical to ones built through full validation."""
+    validated = [DocumentChunk(**fields) for fields in _sample_chunk_fields()]
+
+    assert sample_documents == validated
+    assert [doc.model_dump() for doc in sample_documents] == [doc.model_dump() for doc in validated]
+
+
 def test_indexer_initialization_success(mock_opensearch_client):
     indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
 
@@ -75,21 +104,32 @@ def test_indexer_initialization_success(mock_opensearch_client):
         verify_certs=True,
         ssl_assert_hostname=True,
         timeout=30,
+        pool_maxsize=8,
+        http_compress=True,
     )
 
     assert indexer.index_name == "test_index"
     assert indexer.client == mock_opensearch_client.return_value
 
 
+def test_indexer_compression_enabled_and_pool_sized_for_bulk_threads(mock_opensearch_client):
+    """Tests that request compression is on and the connection pool scales with the bulk thread count."""
+    OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200", thread_count=6)
+
+    _, kwargs = mock_opensearch_client.call_args
+    assert kwargs["http_compress"] is True
+    assert kwargs["pool_maxsize"] == 12
+
+
 def test_indexer_initialization_with_empty_index_name_raises_error():
     """Tests that initializing the indexer with an empty index name raises a ValueError."""
     with pytest.raises(ValueError, match="Index name cannot be empty."):
         OpenSearchIndexer(index_name="", proxy_url="http://test_host:9200")
 
 
-def test_index_documents_with_bulk_indexer_success(mock_helpers_bulk, mock_opensearch_client, sample_documents):
+def test_index_documents_with_bulk_indexer_success(mock_parallel_bulk, mock_opensearch_client, sample_documents):
     """Tests that documents are successfully indexed using the bulk helper."""
-    mock_helpers_bulk.return_value = (len(sample_documents), [])
+    mock_parallel_bulk.return_value = _bulk_results(len(sample_documents))
 
     indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
 
@@ -100,28 +140,35 @@ def test_index_documents_with_bulk_indexer_success(mock_helpers_bulk, mock_opens
 
     success_count, errors = indexer.index_documents(sample_documents)
 
-    mock_helpers_bulk.assert_called_once()
+    mock_parallel_bulk.assert_called_once()
+    _, kwargs = mock_parallel_bulk.call_args
+    assert kwargs["thread_count"] == 4
+    assert kwargs["chunk_size"] == 50
+    assert kwargs["queue_size"] == 8
+    assert kwargs["raise_on_error"] is False
+    assert kwargs["filter_path"] == "errors,items.*._id,items.*.status,items.*.error"
+    assert kwargs["index"] == "test_index"
     assert success_count == len(sample_documents)
     assert errors == []
 
 
-def test_index_documents_with_empty_list_returns_zero(mock_helpers_bulk, mock_opensearch_client):
+def test_index_documents_with_empty_list_returns_zero(mock_parallel_bulk, mock_opensearch_client):
     """Tests that passing an empty list of documents returns 0 successes and no errors."""
     indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
     indexer.client = mock_opensearch_client
 
     success_count, errors = indexer.index_documents([])
 
-    mock_helpers_bulk.assert_not_called()
+    mock_parallel_bulk.assert_not_called()
     assert success_count == 0
     assert errors == []
 
 
-def test_index_documents_with_partial_failures(mock_helpers_bulk, mock_opensearch_client, sample_documents):
+def test_index_documents_with_partial_failures(mock_parallel_bulk, mock_opensearch_client, sample_documents):
     """Tests that partial failures from the bulk helper are treated as critical errors and raise IndexingError."""
     mock_errors = [{"index": {"error": {"reason": "Test error"}}}, {"index": {"error": {"reason": "Another error"}}}]
     # Simulate partial success with errors returned
-    mock_helpers_bulk.return_value = (1, mock_errors)
+    mock_parallel_bulk.return_value = _bulk_results(1, mock_errors)
 
     indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
     indexer.client = mock_opensearch_client
@@ -138,10 +185,10 @@ def test_index_documents_with_partial_failures(mock_helpers_bulk, mock_opensearc
     assert "reason=Another error" in message
 
 
-def test_index_documents_raises_on_bulk_exception(mock_helpers_bulk, mock_opensearch_client, sample_documents):
+def test_index_documents_raises_on_bulk_exception(mock_parallel_bulk, mock_opensearch_client, sample_documents):
     """Tests that a bulk operation exception is caught, logged, and re-raised."""
     # Simulate a critical error during the bulk operation
-    mock_helpers_bulk.side_effect = BulkIndexError("Simulated bulk error", ["error1"])
+    mock_parallel_bulk.side_effect = BulkIndexError("Simulated bulk error", ["error1"])
 
     indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
     indexer.client = mock_opensearch_client
@@ -215,6 +262,8 @@ def test_indexer_initialization_with_https_scheme(mock_opensearch_client):
         verify_certs=True,
         ssl_assert_hostname=True,
         timeout=30,
+        pool_maxsize=8,
+        http_compress=True,
     )
     assert indexer.index_name == "secure_index"
 
@@ -227,9 +276,29 @@ def test_generate_bulk_actions_yields_correct_dict(sample_documents, mock_opense
     assert len(actions) == len(sample_documents)
     for doc, action in zip(sample_documents, actions):
         assert action["_op_type"] == "index"
-        assert action["_index"] == "test_index"
+        assert "_index" not in action
         assert action["_id"] == doc.chunk_id
-        assert action["_source"] == doc.model_dump()
+        assert json.loads(action["_source"]) == doc.model_dump(mode="json")
+
+
+def test_generate_bulk_actions_includes_routing(sample_documents, mock_opensearch_client):
+    """Tests that every action is routed by the document's source_doc_id."""
+    indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://host:9200")
+
+    actions = list(indexer._generate_bulk_actions(sample_documents, id_field="chunk_id"))
+
+    assert [action["routing"] for action in actions] == ["doc1", "doc1"]
+    assert expand_action(actions[0])[0] == {"index": {"_id": "doc1-p1-c0", "routing": "doc1"}}
+
+
+def test_generate_bulk_actions_source_matches_default_serializer(sample_documents, mock_opensearch_client):
+    """Tests that the pre-serialised source is equivalent to serialising model_dump() with the client serializer."""
+    indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://host:9200")
+    actions = indexer._generate_bulk_actions(sample_documents, id_field="chunk_id")
+
+    for doc, action in zip(sample_documents, actions):
+        assert JSONSerializer().dumps(action["_source"]) == action["_source"]
+        assert json.loads(action["_source"]) == json.loads(JSONSerializer().dumps(doc.model_dump()))
 
 
 def test_indexer_initialization_with_empty_proxy_url_raises_error():
@@ -248,6 +317,8 @@ def test_indexer_initialization_with_http_scheme_no_port(mock_opensearch_client)
         verify_certs=True,
         ssl_assert_hostname=True,
         timeout=30,
+        pool_maxsize=8,
+        http_compress=True,
     )
     assert indexer.index_name == "http_index"
 
@@ -262,6 +333,8 @@ def test_indexer_initialization_with_https_scheme_and_port(mock_opensearch_clien
         verify_certs=True,
         ssl_assert_hostname=True,
         timeout=30,
+        pool_maxsize=8,
+        http_compress=True,
     )
     assert indexer.index_name == "secure_index"
 
@@ -281,10 +354,12 @@ def test_indexer_initialization_explicit_tls_disabled(mock_opensearch_client):
         verify_certs=False,
         ssl_assert_hostname=False,
         timeout=30,
+        pool_maxsize=8,
+        http_compress=True,
     )
 
 
-def test_index_documents_with_document_page(mock_helpers_bulk, mock_opensearch_client):
+def test_index_documents_with_document_page(mock_parallel_bulk, mock_opensearch_client):
     """Tests indexing DocumentPage objects."""
     sample_pages = [
         DocumentPage(
@@ -294,7 +369,7 @@ def test_index_documents_with_document_page(mock_helpers_bulk, mock_opensearch_c
             text="Page 1 text",
             page_width=8.5,
             page_height=11.0,
-            received_date=datetime.datetime.fromisoformat("2025-11-06"),
+            received_date=RECEIVED_DATE,
             page_count=2,
             s3_page_image_s3_uri="s3://bucket/page1.png",
             correspondence_type="TC19 - ADDITIONAL INFO REQUEST ",
@@ -306,13 +381,13 @@ def test_index_documents_with_document_page(mock_helpers_bulk, mock_opensearch_c
             text="Page 2 text",
             page_width=8.5,
             page_height=11.0,
-            received_date=datetime.datetime.fromisoformat("2025-11-06"),
+            received_date=RECEIVED_DATE,
             page_count=2,
             s3_page_image_s3_uri="s3://bucket/page2.png",
             correspondence_type="TC19 - ADDITIONAL INFO REQUEST ",
         ),
     ]
-    mock_helpers_bulk.return_value = (len(sample_pages), [])
+    mock_parallel_bulk.return_value = _bulk_results(len(sample_pages))
     indexer = OpenSearchIndexer(index_name="page_metadata", proxy_url="http://test_host:9200")
     indexer.client = mock_opensearch_client
     indexer.client.delete_by_query.return_value = {"deleted": 0}
@@ -326,7 +401,7 @@ def test_index_documents_with_document_page(mock_helpers_bulk, mock_opensearch_c
 
 
 def test_index_documents_deletes_by_source_doc_id_if_index_exists(
-    mock_helpers_bulk, mock_opensearch_client, sample_documents, mocker
+    mock_parallel_bulk, mock_opensearch_client, sample_documents, mocker
 ):
     """Ensures delete_documents_by_source_doc_id is called if the index exists."""
     indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
@@ -334,7 +409,7 @@ def test_index_documents_deletes_by_source_doc_id_if_index_exists(
     indexer.client.indices = MagicMock()
     indexer.client.indices.exists.return_value = True
     delete_mock = mocker.patch.object(indexer, "delete_documents_by_source_doc_id")
-    mock_helpers_bulk.return_value = (len(sample_documents), [])
+    mock_parallel_bulk.return_value = _bulk_results(len(sample_documents))
     indexer.client.delete_by_query.return_value = {"deleted": 0}
 
     indexer.index_documents(sample_documents)
@@ -342,7 +417,7 @@ def test_index_documents_deletes_by_source_doc_id_if_index_exists(
 
 
 def test_index_documents_does_not_delete_if_index_does_not_exist(
-    mock_helpers_bulk, mock_opensearch_client, sample_documents, mocker
+    mock_parallel_bulk, mock_opensearch_client, sample_documents, mocker
 ):
     """Ensures delete_documents_by_source_doc_id is not called if the index does not exist."""
     indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
@@ -350,8 +425,281 @@ def test_index_documents_does_not_delete_if_index_does_not_exist(
     indexer.client.indices = MagicMock()
     indexer.client.indices.exists.return_value = False
     delete_mock = mocker.patch.object(indexer, "delete_documents_by_source_doc_id")
-    mock_helpers_bulk.return_value = (len(sample_documents), [])
+    mock_parallel_bulk.return_value = _bulk_results(len(sample_documents))
     indexer.client.delete_by_query.return_value = {"deleted": 0}
 
     indexer.index_documents(sample_documents)
     delete_mock.assert_not_called()
+
+
+def test_index_documents_does_not_delete_when_not_replacing_existing(
+    mock_parallel_bulk, mock_opensearch_client, sample_documents, mocker
+):
+    """Ensures later batches of a document are appended without deleting earlier ones."""
+    indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
+    indexer.client = mock_opensearch_client
+    indexer.client.indices = MagicMock()
+    indexer.client.indices.exists.return_value = True
+    delete_mock = mocker.patch.object(indexer, "delete_documents_by_source_doc_id")
+    mock_parallel_bulk.return_value = _bulk_results(len(sample_documents))
+
+    indexer.index_documents(sample_documents, replace_existing=False)
+
+    delete_mock.assert_not_called()
+    mock_parallel_bulk.assert_called_once()
+
+
+@pytest.fixture
+def ready_indexer(mock_opensearch_client):
+    """Provides an indexer whose target index does not exist yet, so no deletion happens up front."""
+    indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200", thread_count=2)
+    indexer.client = mock_opensearch_client
+    indexer.client.delete_by_query.return_value = {"deleted": 0}
+    indexer.client.indices = MagicMock()
+    indexer.client.indices.exists.return_value = False
+    return indexer
+
+
+def test_index_documents_streams_actions_to_parallel_bulk(mock_parallel_bulk, ready_indexer, sample_documents):
+    """Tests that the bulk helper is fed a lazy action generator with the configured concurrency."""
+    mock_parallel_bulk.return_value = _bulk_results(len(sample_documents))
+
+    ready_indexer.index_documents(sample_documents)
+
+    args, kwargs = mock_parallel_bulk.call_args
+    assert not isinstance(args[1], list)
+    assert [action["_id"] for action in args[1]] == ["doc1-p1-c0", "doc1-p1-c1"]
+    assert kwargs["thread_count"] == 2
+    assert kwargs["queue_size"] == 4
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ConnectionTimeout("TIMEOUT", "timed out", None), TransportError(429, "too_many_requests", {})],
+    ids=["timeout", "too_many_requests"],
+)
+def test_index_documents_retries_with_backoff_on_retryable_error(
+    mock_parallel_bulk, ready_indexer, sample_documents, mocker, error
+):
+    """Tests that timeouts and 429 responses are retried with exponential backoff."""
+    mock_sleep = mocker.patch("ingestion_pipeline.indexing.indexer.time.sleep")
+    mock_parallel_bulk.side_effect = [error, error, _bulk_results(len(sample_documents))]
+
+    success_count, errors = ready_indexer.index_documents(sample_documents)
+
+    assert success_count == len(sample_documents)
+    assert errors == []
+    assert mock_parallel_bulk.call_count == 3
+    assert mock_sleep.call_args_list == [mocker.call(1), mocker.call(2)]
+
+
+def test_index_documents_gives_up_after_max_retries(mock_parallel_bulk, ready_indexer, sample_documents, mocker):
+    """Tests that a persistently overloaded cluster surfaces as an IndexingError after the last retry."""
+    mocker.patch("ingestion_pipeline.indexing.indexer.time.sleep")
+    mock_parallel_bulk.side_effect = TransportError(429, "too_many_requests", {})
+
+    with pytest.raises(IndexingError, match="Failed to index"):
+        ready_indexer.index_documents(sample_documents)
+
+    assert mock_parallel_bulk.call_count == 3
+
+
+def test_index_documents_does_not_retry_non_retryable_error(
+    mock_parallel_bulk, ready_indexer, sample_documents, mocker
+):
+    """Tests that client errors are not retried."""
+    mock_sleep = mocker.patch("ingestion_pipeline.indexing.indexer.time.sleep")
+    mock_parallel_bulk.side_effect = TransportError(400, "mapper_parsing_exception", {})
+
+    with pytest.raises(IndexingError):
+        ready_indexer.index_documents(sample_documents)
+
+    mock_parallel_bulk.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_index_documents_handles_filtered_bulk_response(mock_opensearch_client, sample_documents):
+    """Tests that a response trimmed by filter_path still yields successes and error summaries."""
+    indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200", thread_count=1)
+    indexer.client = MagicMock()
+    indexer.client.transport.serializer = JSONSerializer()
+    indexer.client.delete_by_query.return_value = {"deleted": 0}
+    indexer.client.indices.exists.return_value = False
+    indexer.client.bulk.return_value = {
+        "errors": True,
+        "items": [
+            {"index": {"_id": "doc1-p1-c0", "status": 201}},
+            {
+                "index": {
+                    "_id": "doc1-p1-c1",
+                    "status": 400,
+                    "error": {"type": "mapper_parsing_exception", "reason": "bad field"},
+                }
+            },
+        ],
+    }
+
+    with pytest.raises(IndexingError, match=r"1x\(status=400, type=mapper_parsing_exception, reason=bad field\)"):
+        indexer.index_documents(sample_documents)
+
+    _, kwargs = indexer.client.bulk.call_args
+    assert kwargs["filter_path"] == "errors,items.*._id,items.*.status,items.*.error"
+    assert kwargs["index"] == "test_index"
+    assert kwargs["body"].splitlines()[0] == '{"index":{"_id":"doc1-p1-c0","routing":"doc1"}}'
+
+
+def _retryable_item(doc_id, status=429):
+    return {"index": {"_id": doc_id, "status": status, "error": {"type": "es_rejected_execution_exception"}}}
+
+
+def test_index_documents_retries_only_rejected_items(mock_parallel_bulk, ready_indexer, sample_documents, mocker):
+    """Tests that items rejected with a transient status are resent on their own and counted once indexed."""
+    mock_sleep = mocker.patch("ingestion_pipeline.indexing.indexer.time.sleep")
+    mock_parallel_bulk.side_effect = [
+        _bulk_results(1, [_retryable_item("doc1-p1-c1")]),
+        _bulk_results(1),
+    ]
+
+    success_count, errors = ready_indexer.index_documents(sample_documents)
+
+    assert success_count == 2
+    assert errors == []
+    retried_actions = list(mock_parallel_bulk.call_args_list[1].args[1])
+    assert [action["_id"] for action in retried_actions] == ["doc1-p1-c1"]
+    mock_sleep.assert_called_once_with(1)
+
+
+def test_index_documents_does_not_retry_when_any_item_is_non_retryable(
+    mock_parallel_bulk, ready_indexer, sample_documents, mocker
+):
+    """Tests that a permanent item failure fails the batch without retrying the transient ones."""
+    mocker.patch("ingestion_pipeline.indexing.indexer.time.sleep")
+    mock_parallel_bulk.return_value = _bulk_results(
+        0, [_retryable_item("doc1-p1-c0", status=503), _retryable_item("doc1-p1-c1", status=400)]
+    )
+
+    with pytest.raises(IndexingError, match="Failed to index 2 chunk"):
+        ready_indexer.index_documents(sample_documents)
+
+    mock_parallel_bulk.assert_called_once()
+
+
+def test_index_documents_fails_when_items_stay_rejected(mock_parallel_bulk, ready_indexer, sample_documents, mocker):
+    """Tests that items still rejected after the last retry fail the batch and trigger cleanup."""
+    mocker.patch("ingestion_pipeline.indexing.indexer.time.sleep")
+    mock_parallel_bulk.return_value = _bulk_results(0, [_retryable_item("doc1-p1-c0"), _retryable_item("doc1-p1-c1")])
+    delete_mock = mocker.patch.object(ready_indexer, "delete_documents_by_source_doc_id")
+
+    with pytest.raises(IndexingError, match="status=429"):
+        ready_indexer.index_documents(sample_documents)
+
+    assert mock_parallel_bulk.call_count == 3
+    delete_mock.assert_called_once_with("doc1")
+
+
+@pytest.fixture
+def refresh_indexer(mocker):
+    """Provides an indexer with a plain mock client for refresh interval tests."""
+    mocker.patch("ingestion_pipeline.indexing.indexer.OpenSearch")
+    indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200", suspend_refresh=True)
+    indexer.client = MagicMock()
+    indexer.client.delete_by_query.return_value = {"deleted": 0}
+    indexer.client.indices.exists.return_value = True
+    return indexer
+
+
+@pytest.mark.parametrize(
+    ("settings_response", "expected_restored"),
+    [
+        ({"test_index": {"settings": {"index": {"refresh_interval": "30s"}}}}, "30s"),
+        ({"test_index_v2": {"settings": {"index": {"refresh_interval": "30s"}}}}, "30s"),
+        ({"test_index": {"settings": {}}}, None),
+    ],
+    ids=["explicit_interval", "alias", "cluster_default"],
+)
+def test_context_manager_suspends_and_restores_refresh(refresh_indexer, settings_response, expected_restored):
+    """Tests that refresh is disabled for the ingest and the previous interval restored with one refresh."""
+    indices = refresh_indexer.client.indices
+    indices.get_settings.return_value = settings_response
+
+    with refresh_indexer as indexer:
+        assert indexer is refresh_indexer
+        indices.put_settings.assert_called_once_with(index="test_index", body={"index": {"refresh_interval": "-1"}})
+        indices.refresh.assert_not_called()
+
+    assert indices.put_settings.call_args_list[-1] == call(
+        index="test_index", body={"index": {"refresh_interval": expected_restored}}
+    )
+    indices.refresh.assert_called_once_with(index="test_index")
+
+
+def test_context_manager_leaves_refresh_suspended_by_another_reload(refresh_indexer):
+    """Tests that an interval of -1 set by a concurrent reload is neither overwritten nor restored."""
+    indices = refresh_indexer.client.indices
+    indices.get_settings.return_value = {"test_index": {"settings": {"index": {"refresh_interval": "-1"}}}}
+
+    with refresh_indexer:
+        refresh_indexer.delete_documents_by_source_doc_id("doc1")
+
+    indices.put_settings.assert_not_called()
+    assert indices.refresh.call_count == 2
+
+
+def test_context_manager_is_a_no_op_unless_suspend_refresh_requested(mocker):
+    """Tests that by default the settings of a shared index are not touched during an ingest."""
+    mocker.patch("ingestion_pipeline.indexing.indexer.OpenSearch")
+    indexer = OpenSearchIndexer(index_name="test_index", proxy_url="http://test_host:9200")
+    indexer.client = MagicMock()
+
+    with indexer:
+        pass
+
+    indexer.client.indices.exists.assert_not_called()
+    indexer.client.indices.put_settings.assert_not_called()
+    indexer.client.indices.refresh.assert_not_called()
+
+
+def test_context_manager_leaves_missing_index_untouched(refresh_indexer):
+    """Tests that the first ingest into a new index does not touch settings of an index that does not exist."""
+    indices = refresh_indexer.client.indices
+    indices.exists.return_value = False
+
+    with refresh_indexer:
+        pass
+
+    indices.get_settings.assert_not_called()
+    indices.put_settings.assert_not_called()
+    indices.refresh.assert_not_called()
+
+
+def test_delete_refreshes_first_while_refresh_is_suspended(refresh_indexer):
+    """Tests that cleanup inside an ingest refreshes so delete_by_query can see unrefreshed writes."""
+    refresh_indexer.client.indices.get_settings.return_value = {}
+
+    with refresh_indexer:
+        refresh_indexer.delete_documents_by_source_doc_id("doc1")
+        refresh_indexer.client.indices.refresh.assert_called_once_with(index="test_index")
+
+    refresh_indexer.client.indices.refresh.reset_mock()
+    refresh_indexer.delete_documents_by_source_doc_id("doc1")
+    refresh_indexer.client.indices.refresh.assert_not_called()
+
+
+def test_context_manager_raises_when_restore_fails_after_success(refresh_indexer):
+    """Tests that a failed restore is surfaced when the ingest itself succeeded."""
+    refresh_indexer.client.indices.get_settings.return_value = {}
+    refresh_indexer.client.indices.refresh.side_effect = RuntimeError("cluster unavailable")
+
+    with pytest.raises(IndexingError, match="Failed to restore refresh on index test_index"):
+        with refresh_indexer:
+            pass
+
+
+def test_context_manager_does_not_mask_ingest_error_when_restore_fails(refresh_indexer):
+    """Tests that the original ingest error propagates even if restoring refresh also fails."""
+    refresh_indexer.client.indices.get_settings.return_value = {}
+    refresh_indexer.client.indices.refresh.side_effect = RuntimeError("cluster unavailable")
+
+    with pytest.raises(ValueError, match="ingest failed"):
+        with refresh_indexer:
+            raise ValueError("ingest failed")
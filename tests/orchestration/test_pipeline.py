@@ -4,15 +4,19 @@ from unittest import mock
 
 import pytest
 
+from ingestion_pipeline.chunking.chunk_strategy import ChunkStrategy
 from ingestion_pipeline.chunking.schemas import DocumentMetadata
 from ingestion_pipeline.chunking.strategies.layout.layout_chunk_handler import ChunkError
-from ingestion_pipeline.embedding.embedding_generator import EmbeddingError
-from ingestion_pipeline.indexing.indexer import IndexingError
+from ingestion_pipeline.custom_logging.log_context import ContextFilter, source_doc_id_context
+from ingestion_pipeline.embedding.embedding_batcher import EmbeddingBatcher
+from ingestion_pipeline.embedding.embedding_generator import EmbeddingError, EmbeddingGenerator
+from ingestion_pipeline.indexing.indexer import IndexingError, OpenSearchIndexer
 from ingestion_pipeline.orchestration.pipeline import Pipeline, PipelineError
-from ingestion_pipeline.textract.textract_processor import TextractProcessingError
+from ingestion_pipeline.page_processor.processor import PageProcessor
+from ingestion_pipeline.textract.textract_processor import TextractProcessingError, TextractProcessor
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def document_metadata():
     return DocumentMetadata(
         source_doc_id="doc-123-test",
@@ -27,32 +31,32 @@ def document_metadata():
 
 @pytest.fixture
 def mock_textract_processor():
-    return mock.Mock()
+    return mock.Mock(spec_set=TextractProcessor)
 
 
 @pytest.fixture
 def mock_chunker():
-    return mock.Mock()
+    return mock.Mock(spec_set=ChunkStrategy)
 
 
 @pytest.fixture
 def mock_embedding_generator():
-    return mock.Mock()
+    return mock.Mock(spec_set=EmbeddingGenerator)
 
 
 @pytest.fixture
 def mock_chunk_indexer():
-    return mock.Mock()
+    return mock.MagicMock(spec_set=OpenSearchIndexer)
 
 
 @pytest.fixture
 def mock_page_indexer():
-    return mock.Mock()
+    return mock.Mock(spec_set=OpenSearchIndexer)
 
 
 @pytest.fixture
 def mock_page_processor():
-    return mock.Mock()
+    return mock.Mock(spec_set=PageProcessor)
 
 
 @pytest.fixture
@@ -74,6 +78,15 @@ def pipeline(
     )
 
 
+def record_indexed_embeddings(mock_chunk_indexer):
+    """Capture each chunk's embedding at the moment it is indexed, before the pipeline releases it."""
+    indexed_embeddings = []
+    mock_chunk_indexer.index_documents.side_effect = lambda batch, **kwargs: indexed_embeddings.extend(
+        chunk.embedding for chunk in batch
+    )
+    return indexed_embeddings
+
+
 @pytest.fixture(autouse=True)
 def suppress_pipeline_errors(caplog):
     caplog.set_level(logging.ERROR)
@@ -89,16 +102,16 @@ def test_process_document_success(
     mock_page_indexer,
     mock_page_processor,
 ):
-    mock_document = mock.Mock()
+    mock_document = mock.Mock(spec=["num_pages"])
     mock_document.num_pages = 5
     mock_textract_processor.process_document.return_value = mock_document
 
-    processed_data = mock.Mock()
-    chunk = mock.Mock()
+    processed_data = mock.Mock(spec=["chunks"])
+    chunk = mock.Mock(spec=["chunk_text", "embedding"], chunk_text="chunk text")
     processed_data.chunks = [chunk]
     mock_chunker.chunk.return_value = processed_data
-    mock_embedding_generator.generate_embedding.return_value = [0.1, 0.2]
-    mock_chunk_indexer.index_documents.return_value = None
+    mock_embedding_generator.generate_embeddings.return_value = [[0.1, 0.2]]
+    indexed_embeddings = record_indexed_embeddings(mock_chunk_indexer)
 
     page_documents = [mock.Mock()]
     mock_page_processor.process.return_value = page_documents
@@ -110,8 +123,189 @@ def test_process_document_success(
     mock_page_processor.process.assert_called_once_with(mock_document, mock.ANY)
     mock_page_indexer.index_documents.assert_called_once_with(page_documents, id_field="page_id")
     mock_chunker.chunk.assert_called_once()
-    mock_embedding_generator.generate_embedding.assert_called_once_with(chunk.chunk_text)
-    mock_chunk_indexer.index_documents.assert_called_once_with(processed_data.chunks)
+    mock_embedding_generator.generate_embeddings.assert_called_once_with([chunk.chunk_text])
+    assert indexed_embeddings == [[0.1, 0.2]]
+    assert chunk.embedding is None
+    mock_chunk_indexer.index_documents.assert_called_once_with(processed_data.chunks, replace_existing=True)
+
+
+def test_process_document_embeds_all_chunks_in_one_batch(
+    pipeline,
+    document_metadata,
+    mock_textract_processor,
+    mock_chunker,
+    mock_embedding_generator,
+    mock_chunk_indexer,
+    mock_page_processor,
+):
+    mock_document = mock.Mock(spec=["num_pages"])
+    mock_document.num_pages = 1
+    mock_textract_processor.process_document.return_value = mock_document
+    mock_page_processor.process.return_value = [mock.Mock()]
+
+    chunks = [
+        mock.Mock(spec=["chunk_text", "embedding"], chunk_text="first"),
+        mock.Mock(spec=["chunk_text", "embedding"], chunk_text="second"),
+    ]
+    mock_chunker.chunk.return_value = mock.Mock(spec=["chunks"], chunks=chunks)
+    mock_embedding_generator.generate_embeddings.return_value = [[0.1], [0.2]]
+    indexed_embeddings = record_indexed_embeddings(mock_chunk_indexer)
+
+    pipeline.process_document(document_metadata)
+
+    mock_embedding_generator.generate_embeddings.assert_called_once_with(["first", "second"])
+    mock_embedding_generator.generate_embedding.assert_not_called()
+    assert indexed_embeddings == [[0.1], [0.2]]
+
+
+def test_process_document_embeds_chunks_per_micro_batch(
+    document_metadata,
+    mock_textract_processor,
+    mock_chunker,
+    mock_embedding_generator,
+    mock_chunk_indexer,
+    mock_page_indexer,
+    mock_page_processor,
+):
+    pipeline = Pipeline(
+        textract_processor=mock_textract_processor,
+        chunker=mock_chunker,
+        embedding_generator=mock_embedding_generator,
+        chunk_indexer=mock_chunk_indexer,
+        page_indexer=mock_page_indexer,
+        page_processor=mock_page_processor,
+        embedding_batcher=EmbeddingBatcher(max_items=2),
+    )
+    mock_document = mock.Mock(spec=["num_pages"])
+    mock_document.num_pages = 1
+    mock_textract_processor.process_document.return_value = mock_document
+    mock_page_processor.process.return_value = [mock.Mock()]
+
+    chunks = [mock.Mock(spec=["chunk_text", "embedding"], chunk_text=text) for text in ("one", "two", "three")]
+    mock_chunker.chunk.return_value = mock.Mock(spec=["chunks"], chunks=chunks)
+    mock_embedding_generator.generate_embeddings.side_effect = [[[1.0], [2.0]], [[3.0]]]
+    indexed_embeddings = record_indexed_embeddings(mock_chunk_indexer)
+
+    pipeline.process_document(document_metadata)
+
+    assert mock_embedding_generator.generate_embeddings.call_args_list == [
+        mock.call(["one", "two"]),
+        mock.call(["three"]),
+    ]
+    assert indexed_embeddings == [[1.0], [2.0], [3.0]]
+    assert all(chunk.embedding is None for chunk in chunks)
+    assert mock_chunk_indexer.index_documents.call_args_list == [
+        mock.call(chunks[:2], replace_existing=True),
+        mock.call(chunks[2:], replace_existing=False),
+    ]
+
+
+def test_process_document_suspends_refresh_around_chunk_indexing(
+    pipeline,
+    document_metadata,
+    mock_textract_processor,
+    mock_chunker,
+    mock_embedding_generator,
+    mock_chunk_indexer,
+    mock_page_processor,
+):
+    mock_document = mock.Mock(spec=["num_pages"])
+    mock_document.num_pages = 1
+    mock_textract_processor.process_document.return_value = mock_document
+    mock_page_processor.process.return_value = [mock.Mock()]
+    mock_chunker.chunk.return_value = mock.Mock(
+        spec=["chunks"], chunks=[mock.Mock(spec=["chunk_text", "embedding"], chunk_text="text")]
+    )
+    mock_embedding_generator.generate_embeddings.return_value = [[0.1]]
+
+    pipeline.process_document(document_metadata)
+
+    assert [name for name, _, _ in mock_chunk_indexer.mock_calls] == [
+        "__enter__",
+        "index_documents",
+        "__exit__",
+    ]
+
+
+def test_process_document_keeps_source_doc_id_in_indexer_logs(
+    pipeline,
+    document_metadata,
+    mock_textract_processor,
+    mock_chunker,
+    mock_embedding_generator,
+    mock_chunk_indexer,
+    mock_page_processor,
+    caplog,
+    monkeypatch,
+):
+    mock_document = mock.Mock(spec=["num_pages"])
+    mock_document.num_pages = 1
+    mock_textract_processor.process_document.return_value = mock_document
+    mock_page_processor.process.return_value = [mock.Mock()]
+    mock_chunker.chunk.return_value = mock.Mock(
+        spec=["chunks"], chunks=[mock.Mock(spec=["chunk_text", "embedding"], chunk_text="text")]
+    )
+    mock_embedding_generator.generate_embeddings.return_value = [[0.1]]
+    indexer_logger = logging.getLogger("ingestion_pipeline.indexing.indexer")
+    mock_chunk_indexer.index_documents.side_effect = lambda batch, **kwargs: indexer_logger.info(
+        f"Indexing {len(batch)} documents"
+    )
+    caplog.set_level(logging.INFO, logger=indexer_logger.name)
+    # Capture through a single filtered handler, as in production; ContextFilter rewrites the record in place.
+    monkeypatch.setattr(caplog.handler, "filters", [ContextFilter()])
+    monkeypatch.setattr(logging.getLogger(), "handlers", [caplog.handler])
+    token = source_doc_id_context.set("DOC-123")
+    try:
+        pipeline.process_document(document_metadata)
+    finally:
+        source_doc_id_context.reset(token)
+
+    assert "DOC-123 Indexing 1 documents" in caplog.messages
+
+
+@pytest.mark.parametrize("failing_stage", ["embedding", "indexing"])
+def test_process_document_stops_and_cleans_up_when_a_batch_fails(
+    document_metadata,
+    mock_textract_processor,
+    mock_chunker,
+    mock_embedding_generator,
+    mock_chunk_indexer,
+    mock_page_indexer,
+    mock_page_processor,
+    failing_stage,
+):
+    pipeline = Pipeline(
+        textract_processor=mock_textract_processor,
+        chunker=mock_chunker,
+        embedding_generator=mock_embedding_generator,
+        chunk_indexer=mock_chunk_indexer,
+        page_indexer=mock_page_indexer,
+        page_processor=mock_page_processor,
+        embedding_batcher=EmbeddingBatcher(max_items=1),
+    )
+    mock_document = mock.Mock(spec=["num_pages"])
+    mock_document.num_pages = 1
+    mock_textract_processor.process_document.return_value = mock_document
+    mock_page_processor.process.return_value = [mock.Mock()]
+    mock_chunker.chunk.return_value = mock.Mock(
+        spec=["chunks"],
+        chunks=[mock.Mock(spec=["chunk_text", "embedding"], chunk_text=text) for text in ("a", "b", "c")],
+    )
+
+    if failing_stage == "embedding":
+        expected_error = EmbeddingError
+        mock_embedding_generator.generate_embeddings.side_effect = [[[1.0]], EmbeddingError("throttled")]
+    else:
+        expected_error = IndexingError
+        mock_embedding_generator.generate_embeddings.return_value = [[1.0]]
+        mock_chunk_indexer.index_documents.side_effect = IndexingError("bulk failed")
+
+    with pytest.raises(expected_error):
+        pipeline.process_document(document_metadata)
+
+    assert mock_embedding_generator.generate_embeddings.call_count == 2
+    mock_chunk_indexer.index_documents.assert_called_once()
+    mock_chunk_indexer.delete_documents_by_source_doc_id.assert_called_once_with(document_metadata.source_doc_id)
 
 
 def test_process_document_no_document(
@@ -141,11 +335,11 @@ def test_process_document_no_chunks(
     mock_page_indexer,
     mock_chunk_indexer,
 ):
-    mock_document = mock.Mock()
+    mock_document = mock.Mock(spec=["num_pages"])
     mock_document.num_pages = 2
     mock_textract_processor.process_document.return_value = mock_document
 
-    processed_data = mock.Mock()
+    processed_data = mock.Mock(spec=["chunks"])
     processed_data.chunks = []
     mock_chunker.chunk.return_value = processed_data
 
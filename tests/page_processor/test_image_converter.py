@@ -1,5 +1,6 @@
 import pytest
 
+from ingestion_pipeline.page_processor import image_converter
 from ingestion_pipeline.page_processor.image_converter import ImageConverter
 
 
@@ -10,10 +11,7 @@ def test_pdf_to_images_valid(monkeypatch):
     dummy_image = object()
 
     # Patch convert_from_bytes to return a dummy list
-    monkeypatch.setattr(
-        "ingestion_pipeline.page_processor.image_converter.convert_from_bytes",
-        lambda pdf_bytes: [dummy_image, dummy_image],
-    )
+    monkeypatch.setattr(image_converter, "convert_from_bytes", lambda pdf_bytes: [dummy_image, dummy_image])
 
     # Act
     images = converter.pdf_to_images(dummy_pdf_bytes)
@@ -33,9 +31,8 @@ def test_pdf_to_images_invalid(monkeypatch):
     def raise_pdf_error(pdf_bytes):
         raise Exception("PDFPageCountError")
 
-    monkeypatch.setattr("ingestion_pipeline.page_processor.image_converter.convert_from_bytes", raise_pdf_error)
+    monkeypatch.setattr(image_converter, "convert_from_bytes", raise_pdf_error)
 
     # Act & Assert
-    with pytest.raises(Exception) as excinfo:
+    with pytest.raises(Exception, match="PDFPageCountError"):
         converter.pdf_to_images(invalid_pdf_bytes)
-    assert "PDFPageCountError" in str(excinfo.value)
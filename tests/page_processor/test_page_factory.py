@@ -1,5 +1,7 @@
 import datetime
 
+import pytest
+
 from ingestion_pipeline.chunking.schemas import DocumentMetadata, DocumentPage
 from ingestion_pipeline.page_processor.page_factory import DocumentPageFactory
 
@@ -10,9 +12,9 @@ class DummyPage:
         self.text = text
 
 
-def test_create_document_page_all_fields():
-    factory = DocumentPageFactory()
-    metadata = DocumentMetadata(
+@pytest.fixture(scope="module")
+def metadata():
+    return DocumentMetadata(
         source_doc_id="doc123",
         source_file_name="file.pdf",
         correspondence_type="typeA",
@@ -21,6 +23,10 @@ def test_create_document_page_all_fields():
         source_file_s3_uri="s3://bucket/26-711111/file.pdf",
         received_date=datetime.datetime(2024, 1, 1),
     )
+
+
+def test_create_document_page_all_fields(metadata):
+    factory = DocumentPageFactory()
     page = DummyPage(page_num=1, text="Hello world")
     s3_uri = "s3://bucket/caseX/doc123/pages/1.png"
     img_width = 100
@@ -40,24 +46,15 @@ def test_create_document_page_all_fields():
     assert doc_page.received_date == datetime.datetime(2024, 1, 1)
 
 
-def test_create_document_page_missing_text():
+def test_create_document_page_missing_text(metadata):
     factory = DocumentPageFactory()
-    metadata = DocumentMetadata(
-        source_doc_id="doc456",
-        source_file_name="file2.pdf",
-        correspondence_type="typeB",
-        case_ref="caseY",
-        page_count=1,
-        source_file_s3_uri="s3://bucket/26-711111/file2.pdf",
-        received_date=datetime.datetime(2024, 2, 2),
-    )
 
     class PageNoText:
         def __init__(self, page_num):
             self.page_num = page_num
 
     page = PageNoText(page_num=2)
-    s3_uri = "s3://bucket/caseY/doc456/pages/2.png"
+    s3_uri = "s3://bucket/caseX/doc123/pages/2.png"
     img_width = 150
     img_height = 250
 
@@ -67,19 +64,10 @@ def test_create_document_page_missing_text():
     assert doc_page.text == ""  # Should default to empty string if no text attribute
 
 
-def test_create_document_page_unique_page_id():
+def test_create_document_page_unique_page_id(metadata):
     factory = DocumentPageFactory()
-    metadata = DocumentMetadata(
-        source_doc_id="doc789",
-        source_file_name="file3.pdf",
-        correspondence_type="typeC",
-        case_ref="caseZ",
-        page_count=3,
-        source_file_s3_uri="s3://bucket/26-711111/file3.pdf",
-        received_date=datetime.datetime(2024, 3, 3),
-    )
-    page = DummyPage(page_num=3, text="Page 3 text")
-    s3_uri = "s3://bucket/caseZ/doc789/pages/3.png"
+    page = DummyPage(page_num=2, text="Page 2 text")
+    s3_uri = "s3://bucket/caseX/doc123/pages/2.png"
     img_width = 200
     img_height = 300
 
@@ -2,6 +2,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from ingestion_pipeline.page_processor import s3_document_service
 from ingestion_pipeline.page_processor.s3_document_service import S3DocumentService
 
 
@@ -16,7 +17,7 @@ def service(s3_client):
 
 
 def test_download_pdf_success(service):
-    with patch("ingestion_pipeline.page_processor.s3_document_service.download_file_from_s3") as mock_download:
+    with patch.object(s3_document_service, "download_file_from_s3") as mock_download:
         mock_download.return_value = b"pdf-bytes"
         result = service.download_pdf("s3://source-bucket/path/to/file.pdf")
         assert result == b"pdf-bytes"
@@ -28,63 +29,36 @@ def test_download_pdf_invalid_uri(service):
         service.download_pdf("not-an-s3-uri")
 
 
-def test_download_pdf_failure(service):
-    with patch(
-        "ingestion_pipeline.page_processor.s3_document_service.download_file_from_s3", side_effect=Exception("fail")
-    ):
-        with pytest.raises(RuntimeError) as excinfo:
-            service.download_pdf("s3://source-bucket/path/to/file.pdf")
-        assert "Failed to download PDF from S3" in str(excinfo.value)
-
-
 def test_upload_image_success(service):
-    with patch("ingestion_pipeline.page_processor.s3_document_service.upload_file_to_s3_with_retry") as mock_upload:
+    with patch.object(s3_document_service, "upload_file_to_s3_with_retry") as mock_upload:
         buf = Mock()
         service._upload_image(buf, "some/key.png")
         mock_upload.assert_called_once_with(service.s3_client, buf, "page-bucket", "some/key.png")
 
 
-def test_upload_image_failure(service):
-    with patch(
-        "ingestion_pipeline.page_processor.s3_document_service.upload_file_to_s3_with_retry",
-        side_effect=Exception("fail"),
-    ):
-        with pytest.raises(RuntimeError) as excinfo:
-            service._upload_image(Mock(), "some/key.png")
-        assert "Failed to upload image to S3" in str(excinfo.value)
-
-
-def test__upload_image_raises_runtime_error(service):
-    with patch(
-        "ingestion_pipeline.page_processor.s3_document_service.upload_file_to_s3_with_retry",
-        side_effect=Exception("fail"),
-    ):
-        with pytest.raises(RuntimeError):
-            service._upload_image(Mock(), "key")
-
-
 def test_delete_images_success(service):
-    with patch("ingestion_pipeline.page_processor.s3_document_service.delete_files_from_s3") as mock_delete:
+    with patch.object(s3_document_service, "delete_files_from_s3") as mock_delete:
         service.delete_images(["key1", "key2"])
         mock_delete.assert_called_once_with(service.s3_client, "page-bucket", ["key1", "key2"])
 
 
-def test_delete_images_failure(service):
-    with patch(
-        "ingestion_pipeline.page_processor.s3_document_service.delete_files_from_s3", side_effect=Exception("fail")
-    ):
-        with pytest.raises(RuntimeError) as excinfo:
-            service.delete_images(["key1", "key2"])
-        assert "Failed to delete images from S3" in str(excinfo.value)
-
-
-def test_delete_images_raises_runtime_error(service):
-    with patch(
-        "ingestion_pipeline.page_processor.s3_document_service.delete_files_from_s3",
-        side_effect=Exception("fail"),
-    ):
-        with pytest.raises(RuntimeError):
-            service.delete_images(["key"])
+@pytest.mark.parametrize(
+    "helper_name,method_name,args,expected_message",
+    [
+        (
+            "download_file_from_s3",
+            "download_pdf",
+            ("s3://source-bucket/path/to/file.pdf",),
+            "Failed to download PDF from S3",
+        ),
+        ("upload_file_to_s3_with_retry", "_upload_image", (Mock(), "some/key.png"), "Failed to upload image to S3"),
+        ("delete_files_from_s3", "delete_images", (["key1", "key2"],), "Failed to delete images from S3"),
+    ],
+)
+def test_s3_helper_failure_raises_runtime_error(service, helper_name, method_name, args, expected_message):
+    with patch.object(s3_document_service, helper_name, side_effect=Exception("fail")):
+        with pytest.raises(RuntimeError, match=expected_message):
+            getattr(service, method_name)(*args)
 
 
 def test_upload_page_images_success(service):
@@ -1,62 +1,57 @@
-import os
-import unittest
-
 import boto3
+import pytest
 from botocore.exceptions import ClientError
 from moto import mock_aws
 
 # Import the function to be tested
 from ingestion_pipeline.s3_file_downloader.s3_downloader import download_pdf_from_s3
 
+BUCKET_NAME = "my-test-bucket"
+
+
+@pytest.fixture(scope="module")
+def s3_client():
+    """Starts one mock S3 backend for the module and creates the test bucket once."""
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET_NAME)
+        yield client
+
+
+@pytest.fixture
+def bucket(s3_client):
+    """Yields the shared bucket name and empties the bucket after each test."""
+    yield BUCKET_NAME
+    objects = s3_client.list_objects_v2(Bucket=BUCKET_NAME).get("Contents", [])
+    if objects:
+        s3_client.delete_objects(Bucket=BUCKET_NAME, Delete={"Objects": [{"Key": obj["Key"]} for obj in objects]})
+
+
+def test_download_pdf_successfully(s3_client, bucket, tmp_path):
+    """Test case for successfully downloading a PDF from S3.
+    This test now also implicitly checks that no exception is raised.
+    """
+    file_key = "test.pdf"
+    local_file_path = tmp_path / file_key
+    pdf_content = b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n..."
+
+    s3_client.put_object(Bucket=bucket, Key=file_key, Body=pdf_content)
+
+    # Call the function to be tested
+    download_pdf_from_s3(bucket, file_key, str(local_file_path))
+
+    # Assertions
+    assert local_file_path.read_bytes() == pdf_content
+
+
+def test_download_pdf_raises_error_if_not_found(bucket, tmp_path):
+    """Test that a ClientError is raised if the file does not exist."""
+    non_existent_file_key = "non_existent.pdf"
+    local_file_path = tmp_path / non_existent_file_key
+
+    with pytest.raises(ClientError) as excinfo:
+        download_pdf_from_s3(bucket, non_existent_file_key, str(local_file_path))
 
-@mock_aws
-class TestS3Downloader(unittest.TestCase):
-    def setUp(self):
-        """Set up the mock S3 environment before each test.
-        This method runs before each test function.
-        """
-        self.bucket_name = "my-test-bucket"
-        self.s3_client = boto3.client("s3", region_name="us-east-1")
-        self.s3_client.create_bucket(Bucket=self.bucket_name)
-        self.download_dir = "test_downloads"
-        os.makedirs(self.download_dir, exist_ok=True)
-
-    def tearDown(self):
-        """Clean up the mock S3 environment and local files after each test.
-        This method runs after each test function.
-        """
-        # Clean up downloaded files
-        for item in os.listdir(self.download_dir):
-            os.remove(os.path.join(self.download_dir, item))
-        os.rmdir(self.download_dir)
-
-    def test_download_pdf_successfully(self):
-        """Test case for successfully downloading a PDF from S3.
-        This test now also implicitly checks that no exception is raised.
-        """
-        file_key = "test.pdf"
-        local_file_path = os.path.join(self.download_dir, file_key)
-        pdf_content = b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n..."
-
-        self.s3_client.put_object(Bucket=self.bucket_name, Key=file_key, Body=pdf_content)
-
-        # Call the function to be tested
-        download_pdf_from_s3(self.bucket_name, file_key, local_file_path)
-
-        # Assertions
-        self.assertTrue(os.path.exists(local_file_path))
-        with open(local_file_path, "rb") as f:
-            self.assertEqual(f.read(), pdf_content)
-
-    def test_download_pdf_raises_error_if_not_found(self):
-        """Test that a ClientError is raised if the file does not exist."""
-        non_existent_file_key = "non_existent.pdf"
-        local_file_path = os.path.join(self.download_dir, non_existent_file_key)
-
-        # Use assertRaises as a context manager to check for the exception
-        with self.assertRaises(ClientError) as cm:
-            download_pdf_from_s3(self.bucket_name, non_existent_file_key, local_file_path)
-
-        # Optionally, assert details about the exception
-        self.assertEqual(cm.exception.response["Error"]["Code"], "404")
-        self.assertFalse(os.path.exists(local_file_path))
+    # Optionally, assert details about the exception
+    assert excinfo.value.response["Error"]["Code"] == "404"
+    assert not local_file_path.exists()
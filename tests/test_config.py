@@ -71,46 +71,61 @@ def test_initializer_override():
     assert settings.AWS_REGION == "ap-south-1"
 
 
-@pytest.mark.parametrize("pages", [{0, 1}, {-1, 2}, {1, 2, 3}])
-def test_debug_page_numbers_validation(pages):
-    if any(page < 1 for page in pages):
-        with pytest.raises(ValueError):
-            Settings(DEBUG_PAGE_NUMBERS=pages)
-    else:
-        Settings(DEBUG_PAGE_NUMBERS=pages)  # Should not raise
-
-
-@pytest.mark.parametrize("value", [-10, 0, 10])
-def test_maximum_chunk_size_validation(value):
-    if value <= 0:
-        with pytest.raises(ValueError):
-            Settings(LAYOUT_CHUNKING_MAXIMUM_CHUNK_SIZE=value)
-    else:
+@pytest.mark.parametrize("pages", [{0, 1}, {-1, 2}])
+def test_debug_page_numbers_rejects_non_positive_pages(pages):
+    with pytest.raises(ValueError):
+        Settings(DEBUG_PAGE_NUMBERS=pages)
+
+
+def test_debug_page_numbers_accepts_positive_pages():
+    Settings(DEBUG_PAGE_NUMBERS={1, 2, 3})  # Should not raise
+
+
+@pytest.mark.parametrize("value", [-10, 0])
+def test_maximum_chunk_size_rejects_non_positive(value):
+    with pytest.raises(ValueError):
         Settings(LAYOUT_CHUNKING_MAXIMUM_CHUNK_SIZE=value)
 
 
-@pytest.mark.parametrize("ratio", [-0.1, 0.5, 1.1])
-def test_y_tolerance_ratio_validation(ratio):
-    if not 0.0 <= ratio <= 1.0:
-        with pytest.raises(ValueError):
-            Settings(LAYOUT_CHUNKING_Y_TOLERANCE_RATIO=ratio)
-    else:
+def test_maximum_chunk_size_accepts_positive():
+    Settings(LAYOUT_CHUNKING_MAXIMUM_CHUNK_SIZE=10)
+
+
+@pytest.mark.parametrize("value", [-1, 0])
+def test_bedrock_embedding_max_workers_rejects_non_positive(value):
+    with pytest.raises(ValueError):
+        Settings(BEDROCK_EMBEDDING_MAX_WORKERS=value)
+
+
+def test_bedrock_embedding_max_workers_accepts_positive():
+    Settings(BEDROCK_EMBEDDING_MAX_WORKERS=4)
+
+
+@pytest.mark.parametrize("ratio", [-0.1, 1.1])
+def test_y_tolerance_ratio_rejects_out_of_range(ratio):
+    with pytest.raises(ValueError):
         Settings(LAYOUT_CHUNKING_Y_TOLERANCE_RATIO=ratio)
 
 
-@pytest.mark.parametrize("gap", [-0.5, 0.0, 0.1])
-def test_max_vertical_gap_validation(gap):
-    if gap <= 0.0:
-        with pytest.raises(ValueError):
-            Settings(LAYOUT_CHUNKING_MAX_VERTICAL_GAP=gap)
-    else:
+def test_y_tolerance_ratio_accepts_in_range():
+    Settings(LAYOUT_CHUNKING_Y_TOLERANCE_RATIO=0.5)
+
+
+@pytest.mark.parametrize("gap", [-0.5, 0.0])
+def test_max_vertical_gap_rejects_non_positive(gap):
+    with pytest.raises(ValueError):
         Settings(LAYOUT_CHUNKING_MAX_VERTICAL_GAP=gap)
 
 
-@pytest.mark.parametrize("poll,timeout", [(5, 4), (5, 5), (5, 10)])
-def test_timeout_greater_than_poll_validation(poll, timeout):
-    if timeout <= poll:
-        with pytest.raises(ValueError):
-            Settings(TEXTRACT_API_POLL_INTERVAL_SECONDS=poll, TEXTRACT_API_JOB_TIMEOUT_SECONDS=timeout)
-    else:
+def test_max_vertical_gap_accepts_positive():
+    Settings(LAYOUT_CHUNKING_MAX_VERTICAL_GAP=0.1)
+
+
+@pytest.mark.parametrize("poll,timeout", [(5, 4), (5, 5)], ids=["timeout-below-poll", "timeout-equals-poll"])
+def test_timeout_not_greater_than_poll_is_rejected(poll, timeout):
+    with pytest.raises(ValueError):
         Settings(TEXTRACT_API_POLL_INTERVAL_SECONDS=poll, TEXTRACT_API_JOB_TIMEOUT_SECONDS=timeout)
+
+
+def test_timeout_greater_than_poll_is_accepted():
+    Settings(TEXTRACT_API_POLL_INTERVAL_SECONDS=5, TEXTRACT_API_JOB_TIMEOUT_SECONDS=10)
@@ -1,55 +1,49 @@
 """Tests for the pipeline_builder module."""
 
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
 
 import pytest
 
 from ingestion_pipeline.pipeline_builder import build_pipeline
 
+PATCHED_NAMES = (
+    "get_s3_client",
+    "get_textract_client",
+    "get_textractor_instance",
+    "settings",
+    "TextractProcessor",
+    "get_chunk_strategy",
+    "EmbeddingGenerator",
+    "EmbeddingBatcher",
+    "OpenSearchIndexer",
+    "Pipeline",
+    "S3DocumentService",
+    "ImageConverter",
+    "DocumentPageFactory",
+    "PageProcessor",
+)
+
 
 @pytest.fixture(autouse=True)
 def patch_external_dependencies():
-    with (
-        patch("ingestion_pipeline.pipeline_builder.get_s3_client") as mock_get_s3_client,
-        patch("ingestion_pipeline.pipeline_builder.get_textract_client") as mock_get_textract_client,
-        patch("ingestion_pipeline.pipeline_builder.get_textractor_instance") as mock_get_textractor_instance,
-        patch("ingestion_pipeline.pipeline_builder.settings") as mock_settings,
-        patch("ingestion_pipeline.pipeline_builder.TextractProcessor") as mock_textract_processor,
-        patch("ingestion_pipeline.pipeline_builder.get_chunk_strategy") as mock_get_chunk_strategy,
-        patch("ingestion_pipeline.pipeline_builder.EmbeddingGenerator") as mock_embedding_generator,
-        patch("ingestion_pipeline.pipeline_builder.OpenSearchIndexer") as mock_indexer,
-        patch("ingestion_pipeline.pipeline_builder.Pipeline") as mock_pipeline,
-        patch("ingestion_pipeline.pipeline_builder.S3DocumentService") as mock_s3_document_service,
-        patch("ingestion_pipeline.pipeline_builder.ImageConverter") as mock_image_converter,
-        patch("ingestion_pipeline.pipeline_builder.DocumentPageFactory") as mock_page_factory,
-        patch("ingestion_pipeline.pipeline_builder.PageProcessor") as mock_page_processor,
-    ):
+    with patch.multiple("ingestion_pipeline.pipeline_builder", **dict.fromkeys(PATCHED_NAMES, DEFAULT)) as mocks:
         # Set up minimal config for settings mock
+        mock_settings = mocks["settings"]
         mock_settings.BEDROCK_EMBEDDING_MODEL_ID = "test-model-id"
+        mock_settings.BEDROCK_EMBEDDING_MAX_WORKERS = 4
+        mock_settings.BEDROCK_EMBEDDING_BATCH_MAX_ITEMS = 32
+        mock_settings.BEDROCK_EMBEDDING_BATCH_MAX_TOKENS = 1000
         mock_settings.OPENSEARCH_CHUNK_INDEX_NAME = "test-chunk-index"
         mock_settings.OPENSEARCH_PAGE_METADATA_INDEX_NAME = "test-page-index"
         mock_settings.OPENSEARCH_PROXY_URL = "http://test-proxy"
         mock_settings.OPENSEARCH_VERIFY_CERTS = True
         mock_settings.OPENSEARCH_SSL_ASSERT_HOSTNAME = True
+        mock_settings.OPENSEARCH_SUSPEND_REFRESH_DURING_INGEST = True
         mock_settings.AWS_CICA_S3_SOURCE_DOCUMENT_ROOT_BUCKET = "test-source-bucket"
         mock_settings.AWS_CICA_S3_PAGE_BUCKET = "test-page-bucket"
         mock_settings.LOCAL_DEVELOPMENT_MODE = False
         mock_settings.DOCUMENT_CHUNKING_STRATEGY = "linear-sentence-splitter"
-        yield {
-            "get_s3_client": mock_get_s3_client,
-            "get_textract_client": mock_get_textract_client,
-            "get_textractor_instance": mock_get_textractor_instance,
-            "settings": mock_settings,
-            "TextractProcessor": mock_textract_processor,
-            "get_chunk_strategy": mock_get_chunk_strategy,
-            "EmbeddingGenerator": mock_embedding_generator,
-            "OpenSearchIndexer": mock_indexer,
-            "Pipeline": mock_pipeline,
-            "S3DocumentService": mock_s3_document_service,
-            "ImageConverter": mock_image_converter,
-            "DocumentPageFactory": mock_page_factory,
-            "PageProcessor": mock_page_processor,
-        }
+        yield mocks
 
 
 def test_build_pipeline_wires_up_pipeline_correctly(patch_external_dependencies):
@@ -66,12 +60,18 @@ def test_build_pipeline_wires_up_pipeline_correctly(patch_external_dependencies)
     patch_external_dependencies["ImageConverter"].assert_called_once()
     patch_external_dependencies["DocumentPageFactory"].assert_called_once()
     patch_external_dependencies["TextractProcessor"].assert_called_once()
-    patch_external_dependencies["EmbeddingGenerator"].assert_called_once()
+    patch_external_dependencies["EmbeddingGenerator"].assert_called_once_with(model_id="test-model-id", max_workers=4)
+    patch_external_dependencies["EmbeddingBatcher"].assert_called_once_with(max_items=32, max_tokens=1000)
+    assert (
+        pipeline_mock.call_args.kwargs["embedding_batcher"]
+        == patch_external_dependencies["EmbeddingBatcher"].return_value
+    )
     patch_external_dependencies["OpenSearchIndexer"].assert_any_call(
         index_name="test-chunk-index",
         proxy_url="http://test-proxy",
         verify_certs=True,
         ssl_assert_hostname=True,
+        suspend_refresh=True,
     )
     patch_external_dependencies["OpenSearchIndexer"].assert_any_call(
         index_name="test-page-index",
@@ -4,6 +4,7 @@ from unittest import mock
 
 import pytest
 
+from ingestion_pipeline import runner
 from ingestion_pipeline.chunking.schemas import DocumentMetadata
 from ingestion_pipeline.runner import main
 
@@ -11,23 +12,50 @@ from ingestion_pipeline.runner import main
 
 
 @pytest.fixture(autouse=True)
-def patch_settings():
-    with mock.patch("ingestion_pipeline.runner.settings") as mock_settings:
-        mock_settings.AWS_CICA_S3_SOURCE_DOCUMENT_ROOT_BUCKET = "test-kta-documents-bucket"
-        mock_settings.AWS_CICA_S3_SOURCE_DOCUMENT_CASE_PREFIX = "26-711111"
-        mock_settings.AWS_CICA_S3_SOURCE_DOCUMENT_FILENAME = "Case1_TC19_50_pages_brain_injury.pdf"
-        yield mock_settings
-
-
-@mock.patch("ingestion_pipeline.runner.build_pipeline")
-@mock.patch("ingestion_pipeline.runner.logger")
-@mock.patch("ingestion_pipeline.runner.check_opensearch_health")
-def test_main_successful_execution(mock_check_opensearch_health, mock_logger, mock_build_pipeline):
-    """Test that main executes successfully with valid input."""
-    mock_pipeline = mock.Mock()
-    mock_build_pipeline.return_value = mock_pipeline
-    mock_check_opensearch_health.return_value = True
+def patch_settings(monkeypatch):
+    mock_settings = mock.MagicMock()
+    mock_settings.AWS_CICA_S3_SOURCE_DOCUMENT_ROOT_BUCKET = "test-kta-documents-bucket"
+    mock_settings.AWS_CICA_S3_SOURCE_DOCUMENT_CASE_PREFIX = "26-711111"
+    mock_settings.AWS_CICA_S3_SOURCE_DOCUMENT_FILENAME = "Case1_TC19_50_pages_brain_injury.pdf"
+    monkeypatch.setattr(runner, "settings", mock_settings)
+    return mock_settings
+
+
+@pytest.fixture
+def mock_pipeline():
+    return mock.Mock()
+
+
+@pytest.fixture
+def mock_build_pipeline(monkeypatch, mock_pipeline):
+    mock_build = mock.Mock(return_value=mock_pipeline)
+    monkeypatch.setattr(runner, "build_pipeline", mock_build)
+    return mock_build
+
+
+@pytest.fixture
+def mock_check_opensearch_health(monkeypatch):
+    mock_check = mock.Mock(return_value=True)
+    monkeypatch.setattr(runner, "check_opensearch_health", mock_check)
+    return mock_check
+
+
+@pytest.fixture
+def mock_logger(monkeypatch):
+    mock_runner_logger = mock.MagicMock()
+    monkeypatch.setattr(runner, "logger", mock_runner_logger)
+    return mock_runner_logger
+
 
+@pytest.fixture
+def mock_identifier_class(monkeypatch):
+    mock_identifier_class = mock.MagicMock()
+    monkeypatch.setattr(runner, "DocumentIdentifier", mock_identifier_class)
+    return mock_identifier_class
+
+
+def test_main_successful_execution(mock_check_opensearch_health, mock_logger, mock_build_pipeline, mock_pipeline):
+    """Test that main executes successfully with valid input."""
     main()
 
     mock_build_pipeline.assert_called_once()
@@ -37,39 +65,28 @@ def test_main_successful_execution(mock_check_opensearch_health, mock_logger, mo
     mock_logger.info.assert_any_call("Pipeline runner finished successfully.")
 
 
-@mock.patch("ingestion_pipeline.runner.build_pipeline")
-@mock.patch("ingestion_pipeline.runner.logger")
-@mock.patch("ingestion_pipeline.runner.check_opensearch_health")
-def test_main_handles_pipeline_exception(mock_check_opensearch_health, mock_logger, mock_build_pipeline):
+def test_main_handles_pipeline_exception(mock_check_opensearch_health, mock_build_pipeline, mock_pipeline, caplog):
     """Test that main logs critical error when pipeline raises exception."""
-    mock_pipeline = mock.Mock()
     mock_pipeline.process_document.side_effect = Exception("Pipeline error")
-    mock_build_pipeline.return_value = mock_pipeline
-    mock_check_opensearch_health.return_value = True
 
-    main()
+    with caplog.at_level(logging.CRITICAL, logger="ingestion_pipeline.runner"):
+        main()
 
     mock_pipeline.process_document.assert_called_once()
-    # Accept any value for dynamic fields (UUID, case_ref, s3_uri, exception type)
-    args, kwargs = mock_logger.critical.call_args
-    assert args[0].endswith("Exception: Pipeline error")
-    assert kwargs.get("exc_info", False) is True
+    [record] = [record for record in caplog.records if record.levelno == logging.CRITICAL]
+    # Accept any value for dynamic fields (UUID, s3_uri)
+    assert "case_ref=26-711111" in record.getMessage()
+    assert record.getMessage().endswith("Exception: Pipeline error")
+    assert record.exc_info is not None
 
 
-@mock.patch("ingestion_pipeline.runner.build_pipeline")
-@mock.patch("ingestion_pipeline.runner.DocumentIdentifier")
-@mock.patch("ingestion_pipeline.runner.check_opensearch_health")
 def test_main_creates_correct_document_metadata(
-    mock_check_opensearch_health, mock_identifier_class, mock_build_pipeline
+    mock_check_opensearch_health, mock_identifier_class, mock_build_pipeline, mock_pipeline
 ):
     """Test that main creates DocumentMetadata with correct values."""
-    mock_pipeline = mock.Mock()
-    mock_build_pipeline.return_value = mock_pipeline
-
     mock_identifier = mock.Mock()
     mock_identifier.generate_uuid.return_value = "test-uuid-123"
     mock_identifier_class.return_value = mock_identifier
-    mock_check_opensearch_health.return_value = True
 
     with mock.patch("ingestion_pipeline.runner.datetime") as mock_datetime:
         mock_now = datetime.datetime(2024, 1, 15, 12, 0, 0)
@@ -92,16 +109,15 @@ def test_main_creates_correct_document_metadata(
         assert metadata.case_ref == "26-711111"
         assert metadata.correspondence_type == "TC19 - ADDITIONAL INFO REQUEST"
         assert metadata.page_count is None
+        assert metadata.received_date == mock_now
+        mock_datetime.datetime.now.assert_called_once_with(mock_datetime.timezone.utc)
 
 
-@mock.patch("ingestion_pipeline.runner.build_pipeline")
-@mock.patch("ingestion_pipeline.runner.check_opensearch_health")
-def test_main_emits_traceback_metadata_on_pipeline_failure(mock_check_opensearch_health, mock_build_pipeline, caplog):
+def test_main_emits_traceback_metadata_on_pipeline_failure(
+    mock_check_opensearch_health, mock_build_pipeline, mock_pipeline, caplog
+):
     """Test that runner critical logs retain traceback metadata on pipeline failures."""
-    mock_pipeline = mock.Mock()
     mock_pipeline.process_document.side_effect = RuntimeError("Pipeline error")
-    mock_build_pipeline.return_value = mock_pipeline
-    mock_check_opensearch_health.return_value = True
 
     with caplog.at_level(logging.CRITICAL, logger="ingestion_pipeline.runner"):
         main()
@@ -117,13 +133,10 @@ def test_main_emits_traceback_metadata_on_pipeline_failure(mock_check_opensearch
     assert critical_records[-1].exc_info[0] is RuntimeError
 
 
-@mock.patch("ingestion_pipeline.runner.build_pipeline")
-@mock.patch("ingestion_pipeline.runner.logger")
-@mock.patch("ingestion_pipeline.runner.check_opensearch_health")
-def test_opensearch_health_check_failure_returns(mock_check_opensearch_health, mock_logger, mock_build_pipeline):
+def test_opensearch_health_check_failure_returns(
+    mock_check_opensearch_health, mock_logger, mock_build_pipeline, mock_pipeline
+):
     """Test that main executes successfully with valid input."""
-    mock_pipeline = mock.Mock()
-    mock_build_pipeline.return_value = mock_pipeline
     mock_check_opensearch_health.return_value = False
 
     main()
@@ -7,7 +7,6 @@ import pytest
 from textractcaller.t_call import Textract_API
 from textractor.entities.document import Document
 
-from ingestion_pipeline.orchestration.pipeline import Pipeline
 from ingestion_pipeline.textract.textract_processor import TextractProcessor
 
 
@@ -34,8 +33,8 @@ def mock_textract_client():
 
 @pytest.fixture
 def mock_orchestrator():
-    """Provides a mock ProcessingPipeline object."""
-    return MagicMock(spec=Pipeline)
+    """Provides a mock ProcessingPipeline object exposing only process_document."""
+    return MagicMock(spec_set=["process_document"])
 
 
 def test_init(mock_textractor, mock_textract_client):
@@ -74,13 +73,67 @@ def test_poll_for_job_completion_succeeds(mock_time, mock_sleep, mock_textractor
         {"JobStatus": "SUCCEEDED"},
     ]
 
-    mock_time.side_effect = [1000, 1001, 1002]
+    mock_time.side_effect = [1000, 1001, 1001, 1002]
 
-    processor = TextractProcessor(mock_textractor, mock_textract_client, timeout_seconds=30, poll_interval=1)
+    processor = TextractProcessor(mock_textractor, mock_textract_client, timeout_seconds=30, poll_interval=0)
     status = processor._poll_for_job_completion("job-1")
 
     assert status == "SUCCEEDED"
     assert mock_textract_client.get_document_analysis.call_count == 2
+    mock_sleep.assert_called_once_with(0)
+
+
+@patch("ingestion_pipeline.textract.textract_processor.time.sleep", return_value=None)
+@patch("ingestion_pipeline.textract.textract_processor.time.time", return_value=1000)
+def test_poll_for_job_completion_backs_off_exponentially(mock_time, mock_sleep, mock_textractor, mock_textract_client):
+    """Verifies that the wait between polls doubles and is capped at MAX_POLL_INTERVAL_SECONDS."""
+    mock_textract_client.get_document_analysis.side_effect = [{"JobStatus": "IN_PROGRESS"}] * 6 + [
+        {"JobStatus": "SUCCEEDED"}
+    ]
+
+    processor = TextractProcessor(mock_textractor, mock_textract_client, timeout_seconds=600, poll_interval=5)
+    status = processor._poll_for_job_completion("job-1")
+
+    assert status == "SUCCEEDED"
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 10, 20, 30, 30, 30]
+
+
+@patch("ingestion_pipeline.textract.textract_processor.time.sleep", return_value=None)
+@patch("ingestion_pipeline.textract.textract_processor.time.time", return_value=1000)
+def test_poll_for_job_completion_caps_wait_at_max_poll_interval(
+    mock_time, mock_sleep, mock_textractor, mock_textract_client
+):
+    """Verifies that the backoff ceiling can be configured per processor."""
+    mock_textract_client.get_document_analysis.side_effect = [{"JobStatus": "IN_PROGRESS"}] * 4 + [
+        {"JobStatus": "SUCCEEDED"}
+    ]
+
+    processor = TextractProcessor(
+        mock_textractor, mock_textract_client, timeout_seconds=600, poll_interval=5, max_poll_interval=12
+    )
+    processor._poll_for_job_completion("job-1")
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 10, 12, 12]
+
+
+def test_poll_for_job_completion_never_sleeps_past_deadline(mock_textractor, mock_textract_client):
+    """Verifies that the final wait is shortened so polling does not overrun the timeout."""
+    mock_textract_client.get_document_analysis.return_value = {"JobStatus": "IN_PROGRESS"}
+    clock = {"now": 1000.0}
+
+    def fake_sleep(seconds):
+        clock["now"] += seconds
+
+    with (
+        patch("ingestion_pipeline.textract.textract_processor.time.time", side_effect=lambda: clock["now"]),
+        patch("ingestion_pipeline.textract.textract_processor.time.sleep", side_effect=fake_sleep) as mock_sleep,
+    ):
+        processor = TextractProcessor(mock_textractor, mock_textract_client, timeout_seconds=45, poll_interval=5)
+        with pytest.raises(TimeoutError):
+            processor._poll_for_job_completion("job-1")
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 10, 20, 10]
+    assert clock["now"] == 1045.0
 
 
 @patch.object(TextractProcessor, "_start_textract_job")
@@ -149,19 +202,22 @@ def test_poll_for_job_completion_times_out(mock_time, mock_sleep, mock_textracto
     # Ensure the job status never changes from IN_PROGRESS
     mock_textract_client.get_document_analysis.return_value = {"JobStatus": "IN_PROGRESS"}
 
-    # Simulate time passing to trigger the timeout
-    mock_time.side_effect = [1000, 1010, 1020, 1031]
+    # Simulate the deadline passing after a single poll
+    mock_time.side_effect = [1000, 1000, 1000, 1000 + timeout + 1]
 
     processor = TextractProcessor(
         textractor=mock_textractor,
         textract_client=mock_textract_client,
         timeout_seconds=timeout,
+        poll_interval=0,
     )
 
     with pytest.raises(TimeoutError) as exc_info:
         processor._poll_for_job_completion("job-1")
 
     assert f"Textract job job-1 timed out after {timeout} seconds." in str(exc_info.value)
+    mock_textract_client.get_document_analysis.assert_called_once_with(JobId="job-1")
+    mock_sleep.assert_called_once_with(0)
 
 
 @patch.object(TextractProcessor, "_start_textract_job")
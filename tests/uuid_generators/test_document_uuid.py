@@ -10,7 +10,13 @@ MOCK_NAMESPACE_UUID = "1b671a64-40d5-491e-99b0-da01ff1f3341"
 MOCK_NAMESPACE_OBJ = uuid.UUID(MOCK_NAMESPACE_UUID)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True, scope="module")
+def patch_namespace():
+    with patch("ingestion_pipeline.uuid_generators.document_uuid.NAMESPACE_DOC_INGESTION", MOCK_NAMESPACE_OBJ):
+        yield
+
+
+@pytest.fixture(scope="module")
 def base_data():
     """Provides common data for the UUID generation tests.
     Keys MUST match the DocumentIdentifier model fields.
@@ -23,10 +29,6 @@ def base_data():
     }
 
 
-@patch(
-    "ingestion_pipeline.uuid_generators.document_uuid.NAMESPACE_DOC_INGESTION",
-    MOCK_NAMESPACE_OBJ,
-)
 @pytest.mark.parametrize(
     "page_num, expected_page_str",
     [
@@ -68,10 +70,6 @@ def test_generates_correct_and_valid_uuid(base_data, page_num, expected_page_str
         pytest.fail(f"The generated string '{actual_uuid}' is not a valid UUID.")
 
 
-@patch(
-    "ingestion_pipeline.uuid_generators.document_uuid.NAMESPACE_DOC_INGESTION",
-    MOCK_NAMESPACE_OBJ,
-)
 def test_is_deterministic(base_data):
     """Tests if the function produces the same UUID when called multiple times
     with the exact same inputs.
@@ -87,33 +85,23 @@ def test_is_deterministic(base_data):
     assert uuid1 == uuid2
 
 
-@patch(
-    "ingestion_pipeline.uuid_generators.document_uuid.NAMESPACE_DOC_INGESTION",
-    MOCK_NAMESPACE_OBJ,
+@pytest.fixture(scope="module")
+def base_uuid(base_data):
+    return DocumentIdentifier(**base_data).generate_uuid()
+
+
+@pytest.mark.parametrize(
+    "field, new_value",
+    [
+        ("source_file_name", "another_document.docx"),
+        ("correspondence_type", "DIFFERENT"),
+        ("page_num", 1),  # Adding a page number (testing document vs page)
+    ],
 )
-def test_is_sensitive_to_input_changes(base_data):
+def test_is_sensitive_to_input_changes(base_data, base_uuid, field, new_value):
     """Tests if changing any input parameter results in a different UUID."""
-    # Create the base identifier and get its UUID
-    base_identifier = DocumentIdentifier(**base_data)
-    base_uuid = base_identifier.generate_uuid()
-
-    # 1. Change source_file_name
-    data_new_filename = base_data.copy()
-    data_new_filename["source_file_name"] = "another_document.docx"
-    identifier_new_filename = DocumentIdentifier(**data_new_filename)
-    assert base_uuid != identifier_new_filename.generate_uuid()
-
-    # 2. Change correspondence type
-    data_new_corr_type = base_data.copy()
-    data_new_corr_type["correspondence_type"] = "DIFFERENT"
-    identifier_new_corr_type = DocumentIdentifier(**data_new_corr_type)
-    assert base_uuid != identifier_new_corr_type.generate_uuid()
-
-    # 3. Add a page number (testing document vs page)
-    data_with_page = base_data.copy()
-    data_with_page["page_num"] = 1
-    identifier_with_page = DocumentIdentifier(**data_with_page)
-    assert base_uuid != identifier_with_page.generate_uuid()
+    changed_identifier = DocumentIdentifier(**{**base_data, field: new_value})
+    assert changed_identifier.generate_uuid() != base_uuid
 
 
 def test_page_uuid_is_different_from_document_uuid():